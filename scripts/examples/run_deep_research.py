@@ -17,17 +17,33 @@ Example usage::
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
+import re
 import sys
-from typing import Iterable, List
-
-from tiangong_ai_for_sustainability.llm import (
-    DeepResearchClient,
-    DeepResearchConfig,
-    MCPServerConfig,
-    ResearchPrompt,
+from typing import TYPE_CHECKING, Iterable, List
+
+if TYPE_CHECKING:
+    from tiangong_ai_for_sustainability.llm import MCPServerConfig
+
+_MCP_SERVER_KEYS = frozenset(
+    {
+        "server_label",
+        "server_url",
+        "server_description",
+        "authorization",
+        "connector_id",
+        "allowed_tools",
+        "require_manual_approval",
+        "headers",
+    }
 )
+_MCP_KEY = r"\s*(?:" + "|".join(sorted(_MCP_SERVER_KEYS)) + r")\s*"
+_MCP_ARGUMENT_RE = re.compile(rf"{_MCP_KEY}=[^,]*(?:,{_MCP_KEY}=[^,]*)*")
+_MCP_PAIR_RE = re.compile(r"([^,=]*)=([^,]*)")
+_HEADERS_RE = re.compile(r"[^|:]*:[^|]*(?:\|[^|:]*:[^|]*)*")
+_HEADER_PAIR_RE = re.compile(r"([^|:]*):([^|]*)")
 
 
 def parse_mcp_server(raw: str) -> MCPServerConfig:
@@ -39,46 +55,52 @@ def parse_mcp_server(raw: str) -> MCPServerConfig:
     ``require_manual_approval`` (truthy values), ``connector_id``.
     """
 
-    pieces = {}
-    for part in raw.split(","):
-        if "=" not in part:
-            raise ValueError(f"Expected key=value pairs in --mcp-server argument, got {part!r}")
-        key, value = part.split("=", 1)
-        pieces[key.strip()] = value.strip()
+    from tiangong_ai_for_sustainability.llm import MCPServerConfig
+
+    if _MCP_ARGUMENT_RE.fullmatch(raw) is None:
+        _raise_invalid_mcp_argument(raw)
+    pieces = {key.strip(): value.strip() for key, value in _MCP_PAIR_RE.findall(raw)}
 
-    try:
-        server_label = pieces.pop("server_label")
-        server_url = pieces.pop("server_url")
-    except KeyError as exc:
-        raise ValueError("Both server_label and server_url are required for --mcp-server") from exc
+    server_label = pieces.get("server_label")
+    server_url = pieces.get("server_url")
+    if server_label is None or server_url is None:
+        raise ValueError("Both server_label and server_url are required for --mcp-server")
 
     config = MCPServerConfig(
         server_label=server_label,
         server_url=server_url,
-        server_description=pieces.pop("server_description", None),
-        authorization=pieces.pop("authorization", None),
-        connector_id=pieces.pop("connector_id", None),
+        server_description=pieces.get("server_description"),
+        authorization=pieces.get("authorization"),
+        connector_id=pieces.get("connector_id"),
     )
 
-    if "allowed_tools" in pieces:
-        config.allowed_tools = tuple(item.strip() for item in pieces.pop("allowed_tools").split("|") if item.strip())
-    if "require_manual_approval" in pieces:
-        config.require_manual_approval = pieces.pop("require_manual_approval").lower() in {"1", "true", "yes"}
-    if "headers" in pieces:
-        header_pairs = {}
-        for header in pieces.pop("headers").split("|"):
-            if ":" not in header:
-                raise ValueError("headers value must be colon-separated HTTP header definitions.")
-            name, header_value = header.split(":", 1)
-            header_pairs[name.strip()] = header_value.strip()
-        config.custom_headers = header_pairs
-
-    if pieces:
-        keys = ", ".join(sorted(pieces.keys()))
-        raise ValueError(f"Unsupported keys in --mcp-server argument: {keys}")
+    allowed_tools = pieces.get("allowed_tools")
+    if allowed_tools is not None:
+        config.allowed_tools = tuple(item.strip() for item in allowed_tools.split("|") if item.strip())
+    require_manual_approval = pieces.get("require_manual_approval")
+    if require_manual_approval is not None:
+        config.require_manual_approval = require_manual_approval.lower() in {"1", "true", "yes"}
+    headers = pieces.get("headers")
+    if headers is not None:
+        if _HEADERS_RE.fullmatch(headers) is None:
+            raise ValueError("headers value must be colon-separated HTTP header definitions.")
+        config.custom_headers = {name.strip(): header_value.strip() for name, header_value in _HEADER_PAIR_RE.findall(headers)}
+
     return config
 
 
+def _raise_invalid_mcp_argument(raw: str) -> None:
+    """Explain why ``raw`` does not match the --mcp-server grammar."""
+
+    keys_seen = set()
+    for part in raw.split(","):
+        if "=" not in part:
+            raise ValueError(f"Expected key=value pairs in --mcp-server argument, got {part!r}")
+        keys_seen.add(part.split("=", 1)[0].strip())
+    keys = ", ".join(sorted(keys_seen - _MCP_SERVER_KEYS))
+    raise ValueError(f"Unsupported keys in --mcp-server argument: {keys}")
+
+
 def collect_mcp_servers(arguments: Iterable[str]) -> List[MCPServerConfig]:
     """Convert CLI arguments into MCP server definitions."""
 
@@ -88,7 +110,8 @@ def collect_mcp_servers(arguments: Iterable[str]) -> List[MCPServerConfig]:
     return servers
 
 
-def main(argv: List[str] | None = None) -> int:
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run an OpenAI Deep Research task.")
     parser.add_argument("question", help="Primary research question.")
     parser.add_argument("--context", help="Optional supporting context injected into the prompt.")
@@ -101,12 +124,23 @@ def main(argv: List[str] | None = None) -> int:
     parser.add_argument("--background", action="store_true", help="Request background execution.")
     parser.add_argument("--json", action="store_true", help="Emit the full JSON response.")
     parser.add_argument("--mcp-server", dest="mcp_servers", action="append", default=[], help="Register an MCP server (key=value pairs).")
+    return parser
 
+
+def main(argv: List[str] | None = None) -> int:
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     if not os.environ.get("OPENAI_API_KEY"):
         parser.error("OPENAI_API_KEY must be set before invoking Deep Research.")
 
+    # Deferred so ``--help`` and argument errors do not pay for the OpenAI SDK import.
+    from tiangong_ai_for_sustainability.llm import (
+        DeepResearchClient,
+        DeepResearchConfig,
+        ResearchPrompt,
+    )
+
     prompt = ResearchPrompt(question=args.question, context=args.context, follow_up_questions=args.follow_ups)
 
     config = DeepResearchConfig(
@@ -11,15 +11,22 @@ replication studies or downstream adapters.
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Mapping
 
+try:  # orjson is optional; fall back to the stdlib encoder when it is absent.
+    import orjson
+except ImportError:  # pragma: no cover - depends on runtime environment
+    orjson = None
+
 from tiangong_ai_for_sustainability.config import load_secrets
 from tiangong_ai_for_sustainability.core.mcp_client import MCPToolClient
-from tiangong_ai_for_sustainability.core.mcp_config import load_mcp_server_configs
+from tiangong_ai_for_sustainability.core.mcp_config import MCPServerConfig, load_mcp_server_configs
 
 
 @dataclass(frozen=True)
@@ -53,9 +60,11 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--concept",
+        dest="concepts",
+        nargs="+",
         choices=sorted(CORPUS_PRESETS.keys()),
-        default="safer",
-        help="Concept preset to collect (default: safer).",
+        default=["safer"],
+        help="Concept preset(s) to collect in one run (default: safer).",
     )
     parser.add_argument(
         "--top-k",
@@ -80,7 +89,10 @@ def parse_args() -> argparse.Namespace:
         default="tiangong_ai_remote",
         help="MCP service name configured in secrets (default: %(default)s).",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if len(args.concepts) > 1 and args.output.name != "placeholder.json":
+        parser.error("--output must be a placeholder path when collecting several concepts.")
+    return args
 
 
 def _resolve_output_path(path: Path, concept_id: str) -> Path:
@@ -89,26 +101,38 @@ def _resolve_output_path(path: Path, concept_id: str) -> Path:
     return path
 
 
+@functools.cache
+def _load_mcp_configs() -> Mapping[str, MCPServerConfig]:
+    """Load secrets and MCP server definitions once per process."""
+    return load_mcp_server_configs(load_secrets(strict=True))
+
+
+@functools.cache
+def _mcp_client(service_name: str) -> MCPToolClient:
+    """Return a process-wide client so batch runs reuse the MCP session."""
+    client = MCPToolClient([_load_mcp_configs()[service_name]])
+    atexit.register(client.close)
+    return client
+
+
 def collect_corpus(config: CorpusConfig, *, service_name: str, top_k: int, ext_k: int, output_path: Path) -> Path:
-    secrets = load_secrets(strict=True)
-    configs = load_mcp_server_configs(secrets)
+    configs = _load_mcp_configs()
     if service_name not in configs:
         raise RuntimeError(f"MCP service '{service_name}' not configured in secrets.")
 
     mcp_config = configs[service_name]
-    with MCPToolClient([mcp_config]) as client:
-        payload, attachments = client.invoke_tool(
-            mcp_config.service_name,
-            "Search_Sci_Tool",
-            {
-                "query": config.query,
-                "topK": max(1, min(top_k, 50)),
-                "extK": max(0, min(ext_k, 10)),
-            },
-        )
+    payload, attachments = _mcp_client(service_name).invoke_tool(
+        mcp_config.service_name,
+        "Search_Sci_Tool",
+        {
+            "query": config.query,
+            "topK": max(1, min(top_k, 50)),
+            "extK": max(0, min(ext_k, 10)),
+        },
+    )
 
     try:
-        records = json.loads(payload)
+        records = orjson.loads(payload) if orjson is not None else json.loads(payload)
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
         raise RuntimeError(f"MCP response was not valid JSON: {exc}") from exc
 
@@ -124,27 +148,32 @@ def collect_corpus(config: CorpusConfig, *, service_name: str, top_k: int, ext_k
         "records": records,
         "attachments": attachments or [],
     }
-    output_path.write_text(json.dumps(output_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(output_payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with output_path.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+            json.dump(output_payload, handle, ensure_ascii=False, indent=2)
     return output_path
 
 
 def main() -> int:
     args = parse_args()
-    preset = CORPUS_PRESETS[args.concept]
-    output_path = _resolve_output_path(args.output, preset.concept_id)
-    try:
-        final_path = collect_corpus(
-            preset,
-            service_name=args.service_name,
-            top_k=args.top_k,
-            ext_k=args.ext_k,
-            output_path=output_path,
-        )
-    except Exception as exc:  # pragma: no cover - surfaced to CLI
-        print(f"[collect-mcp-corpus] Error: {exc}", file=sys.stderr)
-        return 1
-
-    print(f"[collect-mcp-corpus] Saved {preset.label} corpus to {final_path}")
+    for concept in args.concepts:
+        preset = CORPUS_PRESETS[concept]
+        output_path = _resolve_output_path(args.output, preset.concept_id)
+        try:
+            final_path = collect_corpus(
+                preset,
+                service_name=args.service_name,
+                top_k=args.top_k,
+                ext_k=args.ext_k,
+                output_path=output_path,
+            )
+        except Exception as exc:  # pragma: no cover - surfaced to CLI
+            print(f"[collect-mcp-corpus] Error: {exc}", file=sys.stderr)
+            return 1
+
+        print(f"[collect-mcp-corpus] Saved {preset.label} corpus to {final_path}")
     return 0
 
 
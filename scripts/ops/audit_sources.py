@@ -10,18 +10,30 @@ verbatim.
 
 from __future__ import annotations
 
+import functools
 import sys
+from typing import TYPE_CHECKING
 
-from typer.main import get_command
+if TYPE_CHECKING:
+    import click
 
-from tiangong_ai_for_sustainability.cli.main import app
+
+@functools.cache
+def _command() -> click.Command:
+    """Convert the Typer app into its Click command once per process."""
+
+    # Imported lazily so loading this module does not pull in Typer/Click and the CLI app.
+    from typer.main import get_command
+
+    from tiangong_ai_for_sustainability.cli.main import app
+
+    return get_command(app)
 
 
 def main(argv: list[str] | None = None) -> int:
-    command = get_command(app)
     args = ["tiangong-research", "sources", "audit", *(argv or sys.argv[1:])]
     try:
-        command.main(args=args, standalone_mode=True)
+        _command().main(args=args, standalone_mode=True)
     except SystemExit as exc:  # pragma: no cover - exercised via integration
         return int(exc.code or 0)
     return 0
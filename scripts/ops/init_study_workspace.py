@@ -9,8 +9,8 @@ study can refine them without relying on topic-specific templates.
 from __future__ import annotations
 
 import argparse
+import os
 from pathlib import Path
-from textwrap import dedent
 from typing import Iterable
 
 DEFAULT_STUDY_ID = "study"
@@ -53,28 +53,30 @@ def parse_args() -> argparse.Namespace:
 
 
 def create_directories(base: Path, subdirs: Iterable[str]) -> None:
+    try:
+        with os.scandir(base) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        existing = set()
     for name in subdirs:
-        (base / name).mkdir(parents=True, exist_ok=True)
+        if name not in existing:
+            (base / name).mkdir(parents=True, exist_ok=True)
 
 
 def write_file(path: Path, content: str, force: bool) -> None:
-    if path.exists() and not force:
-        return
-    path.write_text(content)
-
-
-def build_config_content(study_id: str, auto_execute: bool) -> str:
-    return dedent(
-        f"""\
-        study_id: {study_id}
-        auto_execute: {'true' if auto_execute else 'false'}
-        """
-    )
-
-
-def build_runbook_content(study_id: str) -> str:
-    return dedent(
-        f"""\
+    data = content.encode("utf-8")
+    if path.exists():
+        if not force:
+            return
+        try:
+            if path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+    path.write_bytes(data)
+
+
+_RUNBOOK_TEMPLATE = """\
 # Study Runbook – {study_id}
 
 ## Workspace Layout
@@ -90,7 +92,7 @@ def build_runbook_content(study_id: str) -> str:
 ```
 
 ## Execution Flags
-- Auto execute after blueprint confirmation: {{auto_execute}}
+- Auto execute after blueprint confirmation: {auto_execute}
 - Blueprint confirmation log: `.cache/tiangong/{study_id}/logs/readiness.md`
 
 ## Deterministic Command Queue
@@ -114,12 +116,8 @@ def build_runbook_content(study_id: str) -> str:
 - [ ] Missing credentials / tooling
 - [ ] Candidate backlog entries
 """
-    )
 
-
-def build_study_brief_content(study_id: str) -> str:
-    return dedent(
-        f"""\
+_STUDY_BRIEF_TEMPLATE = """\
 # Study Blueprint – {study_id}
 
 ## Stage 0 — Environment & Alignment
@@ -150,49 +148,33 @@ def build_study_brief_content(study_id: str) -> str:
 Fill each section as the study progresses. Reference `.cache/tiangong/{study_id}/config.yaml`
 for the auto-execution flag when preparing prompts from `specs/prompts/default.md`.
 """
-    )
-
 
-def build_run_history_content() -> str:
-    return dedent(
-        """\
+_RUN_HISTORY_CONTENT = """\
 # Command Run History
 
 > Append each executed command with timestamp, operator, and primary output path.
 >
 > Example:
 > - 2024-01-01T10:00Z — `uv run tiangong-research sources list` → logs/sources_list.txt
-        """
-    )
-
+"""
 
-def build_exceptions_content() -> str:
-    return dedent(
-        """\
+_EXCEPTIONS_CONTENT = """\
 # Exceptions & Rate Limits Log
 
 | Timestamp | Command / Source | Error | Retry Plan | Status |
 |-----------|-----------------|-------|------------|--------|
 |           |                 |       |            |        |
-        """
-    )
-
+"""
 
-def build_gaps_content(study_id: str) -> str:
-    return dedent(
-        f"""\
+_GAPS_TEMPLATE = """\
 # Evidence Gaps – {study_id}
 
 - Pending metrics:
 - Missing datasets:
 - Follow-up actions:
-        """
-    )
-
+"""
 
-def build_processed_readme_content(study_id: str) -> str:
-    return dedent(
-        f"""\
+_PROCESSED_README_TEMPLATE = """\
 # Processed Artefacts Registry – {study_id}
 
 | File | Description | Source Command / Script |
@@ -201,8 +183,35 @@ def build_processed_readme_content(study_id: str) -> str:
 
 Maintain this table to keep deterministic traceability between inputs and
 processed outputs stored in this directory.
-        """
-    )
+"""
+
+
+def build_config_content(study_id: str, auto_execute: bool) -> str:
+    return f"study_id: {study_id}\nauto_execute: {'true' if auto_execute else 'false'}\n"
+
+
+def build_runbook_content(study_id: str, auto_execute: str) -> str:
+    return _RUNBOOK_TEMPLATE.format_map({"study_id": study_id, "auto_execute": auto_execute})
+
+
+def build_study_brief_content(study_id: str) -> str:
+    return _STUDY_BRIEF_TEMPLATE.format_map({"study_id": study_id})
+
+
+def build_run_history_content() -> str:
+    return _RUN_HISTORY_CONTENT
+
+
+def build_exceptions_content() -> str:
+    return _EXCEPTIONS_CONTENT
+
+
+def build_gaps_content(study_id: str) -> str:
+    return _GAPS_TEMPLATE.format_map({"study_id": study_id})
+
+
+def build_processed_readme_content(study_id: str) -> str:
+    return _PROCESSED_README_TEMPLATE.format_map({"study_id": study_id})
 
 
 def main() -> None:
@@ -215,27 +224,21 @@ def main() -> None:
 
     create_directories(workspace, DIRECTORIES)
 
-    config_path = workspace / "config.yaml"
-    write_file(config_path, build_config_content(study_id, args.auto_execute), args.force)
-
-    docs_dir = workspace / "docs"
-    docs_dir.mkdir(parents=True, exist_ok=True)
-
     auto_flag = "true" if args.auto_execute else "false"
-    runbook = build_runbook_content(study_id).replace("{auto_execute}", auto_flag)
-    study_brief = build_study_brief_content(study_id)
-
-    write_file(docs_dir / "runbook.md", runbook, args.force)
-    write_file(docs_dir / "study_brief.md", study_brief, args.force)
-
+    docs_dir = workspace / "docs"
     logs_dir = workspace / "logs"
-    write_file(logs_dir / "run_history.md", build_run_history_content(), args.force)
-    write_file(logs_dir / "exceptions.md", build_exceptions_content(), args.force)
-
-    write_file(docs_dir / "gaps.md", build_gaps_content(study_id), args.force)
-
     processed_dir = workspace / "processed"
-    write_file(processed_dir / "README.md", build_processed_readme_content(study_id), args.force)
+    files = (
+        (workspace / "config.yaml", build_config_content(study_id, args.auto_execute)),
+        (docs_dir / "runbook.md", build_runbook_content(study_id, auto_flag)),
+        (docs_dir / "study_brief.md", build_study_brief_content(study_id)),
+        (logs_dir / "run_history.md", build_run_history_content()),
+        (logs_dir / "exceptions.md", build_exceptions_content()),
+        (docs_dir / "gaps.md", build_gaps_content(study_id)),
+        (processed_dir / "README.md", build_processed_readme_content(study_id)),
+    )
+    for path, content in files:
+        write_file(path, content, args.force)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@ The generated Markdown keeps only the essentials: the study brief plus direct
 links to the staged workflow and workspace specifications. Headings from the
 canonical documents are summarised so humans and Codex see which sections to
 consult without copying their full text. Pass ``--emit-inline`` to emit the
-single-line prompt alongside the Markdown output.
+single-line prompt alongside the Markdown output. Set ``TGAI_COMPOSE_CACHE=1`` to
+reuse previously composed prompts from ``.cache/tiangong/compose/``.
 
 Example:
     uv run python scripts/tooling/compose_inline_prompt.py
@@ -15,6 +16,11 @@ Example:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import json
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
@@ -28,6 +34,64 @@ MARKDOWN_OUTPUT_FILENAME = "_markdown_prompt.md"
 INLINE_OUTPUT_FILENAME = "_inline_prompt.txt"
 BRIDGE_PHRASE = "By following the staged workflow strictly"
 WORKSPACE_BRIDGE_PHRASE = "Adhere to the study workspace procedures documented here"
+MMAP_THRESHOLD_BYTES = 64 * 1024
+COMPOSE_CACHE_ENV = "TGAI_COMPOSE_CACHE"
+COMPOSE_CACHE_DIR = REPO_ROOT / ".cache" / "tiangong" / "compose"
+_STUDY_BRIEF_HEADING = "## Study Brief"
+_WORKFLOW_SECTION_HEAD = "\n\n".join(
+    (
+        "---",
+        "## Workflow Specification (specs/prompts/default.md)",
+        f"{BRIDGE_PHRASE}. Reference the canonical workflow at `specs/prompts/default.md`.",
+        "### Key Sections",
+    )
+)
+_WORKFLOW_SECTION_TAIL = "\n\n".join(
+    (
+        "### Study-Specific Notes",
+        "- Document deterministic command queues, required sources, overrides, and prompt storage paths under `.cache/tiangong/<STUDY_ID>/docs/`.",
+        "---",
+        "## Workspace Operations (WORKSPACES.md)",
+        f"{WORKSPACE_BRIDGE_PHRASE}. Reference `WORKSPACES.md` for canonical rules.",
+        "### Key Sections",
+    )
+)
+_WORKSPACE_SECTION_TAIL = "\n\n".join(
+    (
+        "### Workspace Notes",
+        "- Record cache locations, logging expectations, dry-run flags, and escalation items per `WORKSPACES.md`.",
+    )
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+MAX_HEADING_LEVEL = 3
+
+
+@functools.lru_cache(maxsize=32)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    if size < MMAP_THRESHOLD_BYTES:
+        with open(path, encoding="utf-8") as handle:
+            return handle.read()
+    # Decode straight from the mapped pages to skip the intermediate bytes copy.
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = str(mapped, "utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` once per process; repeat requests for the same directory are free."""
+    if path in _ENSURED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def read_text_cached(path: Path) -> str:
+    """Read a UTF-8 file, reusing the previous contents while its mtime and size are unchanged."""
+    stat = path.stat()
+    return _read_cached(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def strip_front_matter(raw: str) -> str:
@@ -35,43 +99,52 @@ def strip_front_matter(raw: str) -> str:
     stripped = raw.lstrip()
     if not stripped.startswith("---"):
         return raw
-    lines = stripped.splitlines()
-    front_matter_end = None
-    delimiter_count = 0
-    for idx, line in enumerate(lines):
-        if line.strip() == "---":
-            delimiter_count += 1
-            if delimiter_count == 2:
-                front_matter_end = idx + 1
-                break
-    if front_matter_end is None:
+    opening_end = stripped.find("\n")
+    if opening_end == -1 or stripped[:opening_end].strip() != "---":
         return raw
-    remainder = "\n".join(lines[front_matter_end:])
-    return remainder.lstrip("\n")
+    search_from = opening_end
+    while True:
+        closing_start = stripped.find("\n---", search_from)
+        if closing_start == -1:
+            return raw
+        closing_end = stripped.find("\n", closing_start + 4)
+        if closing_end == -1:
+            closing_end = len(stripped)
+        if not stripped[closing_start + 4 : closing_end].strip():
+            return stripped[closing_end + 1 :].lstrip("\n")
+        search_from = closing_start + 4
 
 
 def inline_text(raw: str) -> str:
     """Collapse multiline Markdown into a single line with canonical spacing."""
-    lines = (line.strip() for line in raw.replace("\r\n", "\n").splitlines())
-    return " ".join(line for line in lines if line)
+    return _WHITESPACE_RE.sub(" ", raw).strip()
+
+
+def _next_heading_line(markdown: str, position: int) -> int:
+    """Return the start of the next line beginning with ``#`` after ``position`` (or -1)."""
+    index = markdown.find("\n#", position)
+    return -1 if index == -1 else index + 1
 
 
 def extract_headings(markdown: str, max_items: int = 8) -> list[str]:
     """Collect key headings to summarise large sections."""
     headings: list[str] = []
-    pattern = re.compile(r"^(#{1,6})\s+(.*)$", flags=re.MULTILINE)
-    for match in pattern.finditer(markdown):
-        level = len(match.group(1))
-        if level > 3:
-            continue
-        title = match.group(2).strip()
-        if title:
-            headings.append(title)
-        if len(headings) >= max_items:
-            break
+    line_start = 0 if markdown.startswith("#") else _next_heading_line(markdown, 0)
+    while line_start != -1 and len(headings) < max_items:
+        line_end = markdown.find("\n", line_start)
+        if line_end == -1:
+            line_end = len(markdown)
+        line = markdown[line_start:line_end]
+        level = len(line) - len(line.lstrip("#"))
+        if level <= MAX_HEADING_LEVEL and line[level : level + 1] in (" ", "\t"):
+            title = line[level:].strip()
+            if title:
+                headings.append(title)
+        line_start = _next_heading_line(markdown, line_end)
     return headings
 
 
+@functools.lru_cache(maxsize=32)
 def compose_prompt(user_text: str, template_text: str, workspace_text: str) -> tuple[str, str]:
     """Combine the study brief with concise workflow and workspace references."""
     workspace_clean = strip_front_matter(workspace_text).strip()
@@ -92,25 +165,41 @@ def compose_prompt(user_text: str, template_text: str, workspace_text: str) -> t
     workflow_bullets = "\n".join(f"- {heading}" for heading in template_headings) if template_headings else "- Refer to `specs/prompts/default.md`."
     workspace_bullets = "\n".join(f"- {heading}" for heading in workspace_headings) if workspace_headings else "- Refer to `WORKSPACES.md`."
 
-    markdown_sections = [
-        "## Study Brief",
-        user_clean,
-        "---",
-        "## Workflow Specification (specs/prompts/default.md)",
-        f"{BRIDGE_PHRASE}. Reference the canonical workflow at `specs/prompts/default.md`.",
-        "### Key Sections",
-        workflow_bullets,
-        "### Study-Specific Notes",
-        "- Document deterministic command queues, required sources, overrides, and prompt storage paths under `.cache/tiangong/<STUDY_ID>/docs/`.",
-        "---",
-        "## Workspace Operations (WORKSPACES.md)",
-        f"{WORKSPACE_BRIDGE_PHRASE}. Reference `WORKSPACES.md` for canonical rules.",
-        "### Key Sections",
-        workspace_bullets,
-        "### Workspace Notes",
-        "- Record cache locations, logging expectations, dry-run flags, and escalation items per `WORKSPACES.md`.",
-    ]
-    markdown_prompt = "\n\n".join(section for section in markdown_sections if section.strip())
+    # Bullets always carry a fallback line, so only an empty brief needs to be skipped.
+    brief_section = f"{_STUDY_BRIEF_HEADING}\n\n{user_clean}" if user_clean else _STUDY_BRIEF_HEADING
+    markdown_prompt = "\n\n".join(
+        (
+            brief_section,
+            _WORKFLOW_SECTION_HEAD,
+            workflow_bullets,
+            _WORKFLOW_SECTION_TAIL,
+            workspace_bullets,
+            _WORKSPACE_SECTION_TAIL,
+        )
+    )
+    return inline_prompt, markdown_prompt
+
+
+def compose_prompt_with_disk_cache(user_text: str, template_text: str, workspace_text: str, cache_dir: Path = COMPOSE_CACHE_DIR) -> tuple[str, str]:
+    """Return composed prompts from ``cache_dir`` when the same inputs were composed before.
+
+    Entries are keyed by a BLAKE2b digest of the three inputs and this script's own
+    source, so edits to either invalidate stale results automatically.
+    """
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    for part in (user_text, template_text, workspace_text):
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    cache_path = cache_dir / f"{digest.hexdigest()}.json"
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        return cached["inline"], cached["markdown"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    inline_prompt, markdown_prompt = compose_prompt(user_text, template_text, workspace_text)
+    _ensure_dir(cache_dir)
+    cache_path.write_text(json.dumps({"inline": inline_prompt, "markdown": markdown_prompt}, ensure_ascii=False), encoding="utf-8")
     return inline_prompt, markdown_prompt
 
 
@@ -155,23 +244,26 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
     try:
-        user_text = args.user_prompt.read_text(encoding="utf-8")
+        user_text = read_text_cached(args.user_prompt)
     except FileNotFoundError:
         print(f"User prompt not found: {args.user_prompt}", file=sys.stderr)
         return 1
     try:
-        template_text = args.spec.read_text(encoding="utf-8")
+        template_text = read_text_cached(args.spec)
     except FileNotFoundError:
         print(f"Specification prompt not found: {args.spec}", file=sys.stderr)
         return 1
 
     try:
-        workspace_text = DEFAULT_WORKSPACES_GUIDE.read_text(encoding="utf-8")
+        workspace_text = read_text_cached(DEFAULT_WORKSPACES_GUIDE)
     except FileNotFoundError:
         print(f"Workspace guide not found: {DEFAULT_WORKSPACES_GUIDE}", file=sys.stderr)
         return 1
 
-    inline_prompt, markdown_prompt = compose_prompt(user_text, template_text, workspace_text)
+    if os.environ.get(COMPOSE_CACHE_ENV, "").lower() in {"1", "true", "yes"}:
+        inline_prompt, markdown_prompt = compose_prompt_with_disk_cache(user_text, template_text, workspace_text)
+    else:
+        inline_prompt, markdown_prompt = compose_prompt(user_text, template_text, workspace_text)
 
     if args.markdown_output:
         if args.markdown_output.is_dir() or args.markdown_output.suffix == "":
@@ -184,21 +276,33 @@ def main(argv: list[str] | None = None) -> int:
         output_dir = DEFAULT_OUTPUT_DIR
         markdown_path = output_dir / MARKDOWN_OUTPUT_FILENAME
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    markdown_path.write_text(markdown_prompt, encoding="utf-8")
+    _ensure_dir(output_dir)
+    markdown_bytes = markdown_prompt.encode("utf-8")
+    markdown_path.write_bytes(markdown_bytes)
+    stdout_chunks = [markdown_bytes, b"\n"]
 
     emit_inline = args.emit_inline or args.inline_output is not None
-    inline_path = None
     if emit_inline:
         inline_path = args.inline_output or output_dir / INLINE_OUTPUT_FILENAME
-        inline_path.parent.mkdir(parents=True, exist_ok=True)
-        inline_path.write_text(inline_prompt, encoding="utf-8")
+        _ensure_dir(inline_path.parent)
+        inline_bytes = inline_prompt.encode("utf-8")
+        inline_path.write_bytes(inline_bytes)
+        stdout_chunks.extend((b"\n[inline] ", inline_bytes, b"\n"))
 
-    print(markdown_prompt)
-    if inline_path:
-        print("\n[inline]", inline_prompt)
+    _write_stdout(b"".join(stdout_chunks))
     return 0
 
 
+def _write_stdout(data: bytes) -> None:
+    """Write pre-encoded UTF-8 output, bypassing the text layer when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
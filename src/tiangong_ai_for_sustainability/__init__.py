@@ -9,15 +9,21 @@ The :mod:`tiangong_ai_for_sustainability.llm.gemini_deep_research` module offers
 minimal client for Gemini Deep Research via the Interactions API.
 """
 
-from .llm import (
-    DeepResearchClient,
-    DeepResearchConfig,
-    DeepResearchResult,
-    GeminiDeepResearchClient,
-    GeminiDeepResearchError,
-    MCPServerConfig,
-    ResearchPrompt,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .llm import (
+        DeepResearchClient,
+        DeepResearchConfig,
+        DeepResearchResult,
+        GeminiDeepResearchClient,
+        GeminiDeepResearchError,
+        MCPServerConfig,
+        ResearchPrompt,
+    )
 
 __all__ = [
     "DeepResearchClient",
@@ -28,3 +34,17 @@ __all__ = [
     "MCPServerConfig",
     "ResearchPrompt",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The LLM clients import the OpenAI SDK, so load them only when first requested
+    # rather than whenever any subpackage (CLI, adapters, workflows) is imported.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".llm", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
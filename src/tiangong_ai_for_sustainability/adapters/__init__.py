@@ -6,8 +6,22 @@ responsible for a small, deterministic surface that can be composed by the
 service layer.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import AdapterError, DataSourceAdapter, VerificationResult
-from .tools import ChartMCPAdapter, OpenAIDeepResearchAdapter, RemoteMCPAdapter
+
+if TYPE_CHECKING:
+    from .tools import ChartMCPAdapter, OpenAIDeepResearchAdapter, RemoteMCPAdapter
+
+# Tool adapters pull in the MCP and OpenAI SDKs, so they are resolved on first access (PEP 562).
+_LAZY_ATTRS = {
+    "ChartMCPAdapter": ".tools",
+    "OpenAIDeepResearchAdapter": ".tools",
+    "RemoteMCPAdapter": ".tools",
+}
 
 __all__ = [
     "AdapterError",
@@ -17,3 +31,16 @@ __all__ = [
     "RemoteMCPAdapter",
     "OpenAIDeepResearchAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,40 +8,80 @@ Each submodule exposes two layers:
   implementations suitable for registry verification or higher-level orchestration.
 """
 
-from .arxiv import ArxivAdapter, ArxivAPIError, ArxivClient
-from .base import APIError, BaseAPIClient
-from .crossref import CrossrefAdapter, CrossrefClient
-from .dify import DifyKnowledgeBaseAdapter, DifyKnowledgeBaseClient
-from .dimensions import DimensionsAIAdapter, DimensionsAIClient
-from .esa_copernicus import CopernicusDataspaceAdapter, CopernicusDataspaceClient
-from .esg import (
-    CdpClimateAdapter,
-    IssESGAdapter,
-    LsegESGAdapter,
-    MsciESGAdapter,
-    SpGlobalESGAdapter,
-    SustainalyticsAdapter,
-)
-from .github_topics import GitHubTopicsAdapter, GitHubTopicsClient
-from .ilostat import ILOSTATAdapter, ILOSTATClient
-from .imf import IMFClimateAdapter, IMFClimateClient
-from .ipbes import IPBESAdapter
-from .ipcc import IPCCDDCAdapter
-from .kaggle import KaggleAdapter, KaggleAPIError, KaggleClient
-from .lens import LensOrgAdapter, LensOrgClient
-from .nasa_earthdata import NasaEarthdataAdapter, NasaEarthdataClient
-from .open_supply_hub import OpenSupplyHubAdapter, OpenSupplyHubClient
-from .openalex import OpenAlexAdapter, OpenAlexClient
-from .osdg import OSDGAdapter, OSDGClient
-from .premium_literature import AcmDigitalLibraryAdapter, ScopusAdapter
-from .semantic_scholar import SemanticScholarAdapter, SemanticScholarClient
-from .standards import GhgProtocolWorkbooksAdapter, GriTaxonomyAdapter
-from .transparency import TransparencyCPIAdapter, TransparencyCPIClient
-from .un_sdg import UNSDGAdapter, UNSDGClient
-from .web_of_science import WebOfScienceAdapter, WebOfScienceClient
-from .wikidata import WikidataAdapter, WikidataClient
-from .world_bank import WorldBankAdapter, WorldBankClient
-from .zenodo import ZenodoCommunityClient, extract_record_doi
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .arxiv import ArxivAdapter, ArxivAPIError, ArxivClient
+    from .base import APIError, BaseAPIClient, ResponseCache
+    from .crossref import CrossrefAdapter, CrossrefClient
+    from .dify import DifyKnowledgeBaseAdapter, DifyKnowledgeBaseClient
+    from .dimensions import DimensionsAIAdapter, DimensionsAIClient
+    from .esa_copernicus import CopernicusDataspaceAdapter, CopernicusDataspaceClient
+    from .esg import (
+        CdpClimateAdapter,
+        IssESGAdapter,
+        LsegESGAdapter,
+        MsciESGAdapter,
+        SpGlobalESGAdapter,
+        SustainalyticsAdapter,
+    )
+    from .github_topics import GitHubTopicsAdapter, GitHubTopicsClient
+    from .ilostat import ILOSTATAdapter, ILOSTATClient
+    from .imf import IMFClimateAdapter, IMFClimateClient
+    from .ipbes import IPBESAdapter
+    from .ipcc import IPCCDDCAdapter
+    from .kaggle import KaggleAdapter, KaggleAPIError, KaggleClient
+    from .lens import LensOrgAdapter, LensOrgClient
+    from .nasa_earthdata import NasaEarthdataAdapter, NasaEarthdataClient
+    from .open_supply_hub import OpenSupplyHubAdapter, OpenSupplyHubClient
+    from .openalex import OpenAlexAdapter, OpenAlexClient
+    from .osdg import OSDGAdapter, OSDGClient
+    from .premium_literature import AcmDigitalLibraryAdapter, ScopusAdapter
+    from .semantic_scholar import SemanticScholarAdapter, SemanticScholarClient
+    from .standards import GhgProtocolWorkbooksAdapter, GriTaxonomyAdapter
+    from .transparency import TransparencyCPIAdapter, TransparencyCPIClient
+    from .un_sdg import UNSDGAdapter, UNSDGClient
+    from .web_of_science import WebOfScienceAdapter, WebOfScienceClient
+    from .wikidata import WikidataAdapter, WikidataClient
+    from .world_bank import WorldBankAdapter, WorldBankClient
+    from .zenodo import ZenodoCommunityClient, extract_record_doi
+
+# Submodules are imported on first attribute access (PEP 562) so callers that
+# need a single client do not pay for every HTTP adapter and its SDK.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".arxiv": ("ArxivAdapter", "ArxivAPIError", "ArxivClient"),
+    ".base": ("APIError", "BaseAPIClient", "ResponseCache"),
+    ".crossref": ("CrossrefAdapter", "CrossrefClient"),
+    ".dify": ("DifyKnowledgeBaseAdapter", "DifyKnowledgeBaseClient"),
+    ".dimensions": ("DimensionsAIAdapter", "DimensionsAIClient"),
+    ".esa_copernicus": ("CopernicusDataspaceAdapter", "CopernicusDataspaceClient"),
+    ".esg": ("CdpClimateAdapter", "IssESGAdapter", "LsegESGAdapter", "MsciESGAdapter", "SpGlobalESGAdapter", "SustainalyticsAdapter"),
+    ".github_topics": ("GitHubTopicsAdapter", "GitHubTopicsClient"),
+    ".ilostat": ("ILOSTATAdapter", "ILOSTATClient"),
+    ".imf": ("IMFClimateAdapter", "IMFClimateClient"),
+    ".ipbes": ("IPBESAdapter",),
+    ".ipcc": ("IPCCDDCAdapter",),
+    ".kaggle": ("KaggleAdapter", "KaggleAPIError", "KaggleClient"),
+    ".lens": ("LensOrgAdapter", "LensOrgClient"),
+    ".nasa_earthdata": ("NasaEarthdataAdapter", "NasaEarthdataClient"),
+    ".open_supply_hub": ("OpenSupplyHubAdapter", "OpenSupplyHubClient"),
+    ".openalex": ("OpenAlexAdapter", "OpenAlexClient"),
+    ".osdg": ("OSDGAdapter", "OSDGClient"),
+    ".premium_literature": ("AcmDigitalLibraryAdapter", "ScopusAdapter"),
+    ".semantic_scholar": ("SemanticScholarAdapter", "SemanticScholarClient"),
+    ".standards": ("GhgProtocolWorkbooksAdapter", "GriTaxonomyAdapter"),
+    ".transparency": ("TransparencyCPIAdapter", "TransparencyCPIClient"),
+    ".un_sdg": ("UNSDGAdapter", "UNSDGClient"),
+    ".web_of_science": ("WebOfScienceAdapter", "WebOfScienceClient"),
+    ".wikidata": ("WikidataAdapter", "WikidataClient"),
+    ".world_bank": ("WorldBankAdapter", "WorldBankClient"),
+    ".zenodo": ("ZenodoCommunityClient", "extract_record_doi"),
+}
+_LAZY_ATTRS = {name: module for module, names in _EXPORTS.items() for name in names}
+
 
 __all__ = [
     "ArxivAdapter",
@@ -49,6 +89,7 @@ __all__ = [
     "ArxivClient",
     "APIError",
     "BaseAPIClient",
+    "ResponseCache",
     "CrossrefAdapter",
     "CrossrefClient",
     "CdpClimateAdapter",
@@ -103,3 +144,16 @@ __all__ = [
     "ZenodoCommunityClient",
     "extract_record_doi",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,13 +6,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import arxiv
 
 from ..base import AdapterError, DataSourceAdapter, VerificationResult
 
 _VERIFICATION_ID = "1707.08567"
+# arXiv serves at most 2000 entries per API call; larger pages mean fewer of the mandated inter-page delays.
+MAX_PAGE_SIZE = 2000
 
 
 class ArxivAPIError(AdapterError):
@@ -32,30 +34,26 @@ def _extract_year(value: Optional[datetime]) -> Optional[int]:
 
 
 def _format_authors(authors: Iterable[object]) -> List[str]:
-    names: List[str] = []
-    for author in authors:
-        name = getattr(author, "name", None)
-        if isinstance(name, str) and name:
-            names.append(name)
-    return names
+    return [name for name in (getattr(author, "name", None) for author in authors) if isinstance(name, str) and name]
 
 
 def _serialise_result(result: arxiv.Result) -> Dict[str, object]:
     short_id = result.get_short_id() if hasattr(result, "get_short_id") else None
+    published = result.published
     return {
         "id": short_id or result.entry_id,
         "entry_id": result.entry_id,
         "arxiv_id": short_id,
         "title": result.title.strip(),
         "summary": result.summary.strip(),
-        "published": _format_datetime(result.published),
+        "published": _format_datetime(published),
         "updated": _format_datetime(result.updated),
-        "year": _extract_year(result.published),
+        "year": _extract_year(published),
         "doi": result.doi,
         "primary_category": result.primary_category,
         "categories": list(result.categories),
         "pdf_url": result.pdf_url,
-        "links": [link.href for link in result.links if getattr(link, "href", None)],
+        "links": [href for href in (getattr(link, "href", None) for link in result.links) if href],
         "authors": _format_authors(result.authors),
     }
 
@@ -65,6 +63,20 @@ class ArxivClient:
     """Thin wrapper around :mod:`arxiv` providing structured dictionaries."""
 
     client: arxiv.Client = field(default_factory=arxiv.Client)
+    _bulk_client: Optional[arxiv.Client] = field(default=None, init=False, repr=False)
+
+    def _client_for(self, max_results: int) -> arxiv.Client:
+        """Return a client that fetches ``max_results`` in as few (delayed) pages as possible."""
+
+        client = self.client
+        page_size = getattr(client, "page_size", None)
+        if not isinstance(page_size, int) or max_results <= page_size:
+            return client
+        wanted = min(max_results, MAX_PAGE_SIZE)
+        bulk = self._bulk_client
+        if bulk is None or bulk.page_size < wanted:
+            bulk = self._bulk_client = arxiv.Client(page_size=wanted, delay_seconds=client.delay_seconds, num_retries=client.num_retries)
+        return bulk
 
     def search_papers(
         self,
@@ -73,12 +85,23 @@ class ArxivClient:
         max_results: int = 10,
         sort_by: arxiv.SortCriterion = arxiv.SortCriterion.Relevance,
     ) -> List[Dict[str, object]]:
+        return list(self.search_papers_iter(query, max_results=max_results, sort_by=sort_by))
+
+    def search_papers_iter(
+        self,
+        query: str,
+        *,
+        max_results: int = 10,
+        sort_by: arxiv.SortCriterion = arxiv.SortCriterion.Relevance,
+    ) -> Iterator[Dict[str, object]]:
+        """Yield serialised results as pages arrive, without buffering the raw :class:`arxiv.Result` objects."""
+
         try:
             search = arxiv.Search(query=query, max_results=max_results, sort_by=sort_by)
-            results = list(self.client.results(search))
-        except Exception as exc:  # pragma: no cover - depends on upstream
+            for result in self._client_for(max_results).results(search):
+                yield _serialise_result(result)
+        except Exception as exc:
             raise ArxivAPIError(f"Failed to query arXiv: {exc}") from exc
-        return [_serialise_result(result) for result in results]
 
     def fetch_by_id(self, arxiv_id: str) -> Dict[str, object]:
         try:
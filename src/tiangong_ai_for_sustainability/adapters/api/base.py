@@ -2,29 +2,175 @@
 Shared HTTP utilities for API adapters.
 
 The helper provides a thin HTTPX wrapper with retry logic tuned for
-specification-driven automation: it keeps the code synchronous, avoids global
-state, and surfaces rich error messages when endpoints fail.
+specification-driven automation: it keeps the code synchronous, shares pooled
+connections between clients with identical configuration, and surfaces rich
+error messages when endpoints fail.
 """
 
 from __future__ import annotations
 
+import atexit
+import base64
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
-from logging import LoggerAdapter
-from typing import Any, Mapping, MutableMapping, Optional
+from logging import DEBUG, LoggerAdapter
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, MutableMapping, Optional, Tuple
 
 import httpx
-from tenacity import RetryError, retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import RetryError, Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from ...core.logging import get_logger
 from ..base import AdapterError
 
+try:  # orjson is optional; fall back to httpx's stdlib JSON handling when it is absent.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 DEFAULT_TIMEOUT = 15.0
+DEFAULT_USER_AGENT = "tiangong-ai-sustainability-cli"
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=15.0)
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60.0
+_CACHED_HEADERS = frozenset({"content-type", "etag", "last-modified"})
+# Request headers folded into cache keys so responses never cross credentials, formats or byte ranges.
+_KEYED_HEADERS = ("accept", "authorization", "range", "x-api-key")
+_JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+# HTTP/2 multiplexes concurrent requests to the same host over one connection; it needs the optional ``h2`` package.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Shared retry policy; tenacity keeps per-call state thread-locally so one instance serves every client.
+_RETRYING = Retrying(
+    retry=retry_if_exception_type(httpx.HTTPError),
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+
+_SharedClientKey = Tuple[str, float]
+_SHARED_CLIENTS: Dict[_SharedClientKey, httpx.Client] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(base_url: str, timeout: float) -> httpx.Client:
+    """Return the process-wide client for this configuration, creating it on first use."""
+
+    key = (base_url, timeout)
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = _SHARED_CLIENTS[key] = httpx.Client(
+                base_url=base_url,
+                timeout=timeout,
+                follow_redirects=True,
+                limits=DEFAULT_LIMITS,
+                http2=HTTP2_AVAILABLE,
+            )
+        return client
+
+
+def _is_shared_client(client: httpx.Client) -> bool:
+    with _SHARED_CLIENTS_LOCK:
+        return any(shared is client for shared in _SHARED_CLIENTS.values())
+
+
+@atexit.register
+def close_shared_clients() -> None:
+    """Close every pooled client; they are recreated on demand afterwards."""
+
+    with _SHARED_CLIENTS_LOCK:
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    for client in clients:
+        client.close()
 
 
 class APIError(AdapterError):
     """Raised when an HTTP API call fails."""
 
 
+@dataclass(slots=True)
+class ResponseCache:
+    """
+    File-backed store for successful, idempotent HTTP responses.
+
+    Entries are JSON documents under ``directory`` keyed by a BLAKE2b digest of
+    the method, full URL (including query string), credential, ``Accept`` and
+    ``Range`` headers, and request body. They expire ``ttl`` seconds after
+    being written; expired entries that carry an ``ETag`` or ``Last-Modified``
+    validator are revalidated with a conditional request and reused when the
+    upstream answers ``304 Not Modified``.
+    """
+
+    directory: Path
+    ttl: float = DEFAULT_CACHE_TTL
+
+    @staticmethod
+    def key_for(request: httpx.Request) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{request.method}|{request.url}|".encode("utf-8"))
+        for name in _KEYED_HEADERS:
+            digest.update(f"{request.headers.get(name, '')}|".encode("utf-8"))
+        digest.update(request.content)
+        return digest.hexdigest()
+
+    def get(self, key: str, request: httpx.Request, *, allow_stale: bool = False) -> Optional[httpx.Response]:
+        path = self.directory / f"{key}.json"
+        try:
+            if not allow_stale and time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            return httpx.Response(
+                entry["status_code"],
+                headers=entry["headers"],
+                content=base64.b64decode(entry["content"]),
+                request=request,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, response: httpx.Response) -> None:
+        entry = {
+            "status_code": response.status_code,
+            "headers": {name: value for name, value in response.headers.items() if name.lower() in _CACHED_HEADERS},
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:  # pragma: no cover - cache writes are best effort
+            tmp_path.unlink(missing_ok=True)
+
+    def touch(self, key: str) -> None:
+        """Restart the expiry clock of an entry confirmed unchanged upstream."""
+
+        try:
+            os.utime(self.directory / f"{key}.json")
+        except OSError:  # pragma: no cover - cache writes are best effort
+            pass
+
+    @staticmethod
+    def validators(response: httpx.Response) -> Dict[str, str]:
+        """Return conditional request headers derived from a cached response."""
+
+        headers: Dict[str, str] = {}
+        etag = response.headers.get("ETag")
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
 @dataclass(slots=True)
 class BaseAPIClient:
     """
@@ -38,26 +184,87 @@ class BaseAPIClient:
         Request timeout in seconds.
     default_headers:
         Headers automatically attached to every request.
+    response_cache:
+        Optional :class:`ResponseCache`. When set, ``GET`` responses (and
+        requests made with ``cacheable=True``) are served from disk until they
+        expire. Left unset, the client stays stateless.
+
+    The underlying :class:`httpx.Client` is created on first use and shared by
+    every instance with the same base URL and timeout, so keep-alive
+    connections are pooled across adapters. ``default_headers`` are sent with
+    each request rather than baked into the shared client, so changes such as a
+    rotated token apply to the next call. :meth:`close` (or
+    leaving a ``with`` block) detaches the instance; shared clients are closed
+    at interpreter exit or via :func:`close_shared_clients`.
     """
 
     base_url: str
     timeout: float = DEFAULT_TIMEOUT
     default_headers: MutableMapping[str, str] = field(default_factory=dict)
-    logger: LoggerAdapter = field(init=False, repr=False)
+    response_cache: Optional[ResponseCache] = None
+    _logger: Optional[LoggerAdapter] = field(default=None, init=False, repr=False)
+    _client: Optional[httpx.Client] = field(default=None, init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        self.logger = get_logger(
-            f"{self.__class__.__module__}.{self.__class__.__name__}",
-            extra={"base_url": self.base_url},
-        )
+    @property
+    def logger(self) -> LoggerAdapter:
+        logger = self._logger
+        if logger is None:
+            logger = self._logger = get_logger(
+                f"{self.__class__.__module__}.{self.__class__.__name__}",
+                extra={"base_url": self.base_url},
+            )
+        return logger
 
     def _build_client(self) -> httpx.Client:
-        return httpx.Client(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers=dict(self.default_headers),
-            follow_redirects=True,
-        )
+        return _shared_client(self.base_url, self.timeout)
+
+    def _request_headers(self, headers: Optional[Mapping[str, str]]) -> Mapping[str, str]:
+        return {**self.default_headers, **headers} if headers else self.default_headers
+
+    def _http_client(self) -> httpx.Client:
+        client = self._client
+        if client is None or client.is_closed:
+            client = self._client = self._build_client()
+        return client
+
+    def close(self) -> None:
+        """Release the HTTP client, closing it unless other instances share it."""
+
+        client = self._client
+        self._client = None
+        if client is not None and not _is_shared_client(client):
+            client.close()
+
+    def __enter__(self) -> "BaseAPIClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def preflight(self) -> Optional[str]:
+        """
+        Return a message describing missing or invalid configuration, or ``None``.
+
+        Adapters call this before verification so misconfigured clients fail
+        immediately instead of waiting on network timeouts. Subclasses extend it
+        with their own required settings.
+        """
+
+        try:
+            url = httpx.URL(self.base_url)
+        except (httpx.InvalidURL, TypeError):
+            return f"Invalid base URL configured: {self.base_url!r}."
+        if url.scheme not in {"http", "https"} or not url.host:
+            return f"Invalid base URL configured: {self.base_url!r}."
+        return None
+
+    @staticmethod
+    def _decode_json(response: httpx.Response) -> Any:
+        """Decode a JSON body, raising :class:`ValueError` on malformed payloads."""
+
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
 
     @staticmethod
     def _raise_for_status(response: httpx.Response) -> None:
@@ -66,55 +273,102 @@ class BaseAPIClient:
         except httpx.HTTPStatusError as exc:  # pragma: no cover - library-provided
             raise APIError(f"HTTP {exc.response.status_code} error for {exc.request.method} {exc.request.url}: {exc.response.text}") from exc
 
-    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        self.logger.debug(
-            "HTTP request",
-            extra={
-                "method": method,
-                "url": url,
-                "params": kwargs.get("params"),
-            },
-        )
-
-        @retry(
-            retry=retry_if_exception_type(httpx.HTTPError),
-            wait=wait_exponential(multiplier=1, min=1, max=8),
-            stop=stop_after_attempt(3),
-            reraise=True,
-        )
-        def _send() -> httpx.Response:
-            with self._build_client() as client:
-                return client.request(method, url, **kwargs)
+    def _request(self, method: str, url: str, *, cacheable: Optional[bool] = None, **kwargs: Any) -> httpx.Response:
+        # Skip building the structured ``extra`` payloads unless debug logging is on.
+        debug = self.logger.isEnabledFor(DEBUG)
+        if debug:
+            self.logger.debug(
+                "HTTP request",
+                extra={
+                    "method": method,
+                    "url": url,
+                    "params": kwargs.get("params"),
+                },
+            )
+
+        kwargs["headers"] = self._request_headers(kwargs.get("headers"))
+        cache = self.response_cache
+        cache_key: Optional[str] = None
+        stale: Optional[httpx.Response] = None
+        if cache is not None and (method == "GET" if cacheable is None else cacheable):
+            request = self._http_client().build_request(method, url, **kwargs)
+            cache_key = cache.key_for(request)
+            cached = cache.get(cache_key, request)
+            if cached is not None:
+                if debug:
+                    self.logger.debug("HTTP cache hit", extra={"method": method, "url": str(request.url)})
+                return cached
+            stale = cache.get(cache_key, request, allow_stale=True)
+            validators = ResponseCache.validators(stale) if stale is not None else None
+            if validators:
+                kwargs["headers"] = {**kwargs["headers"], **validators}
+            else:
+                stale = None
 
         try:
-            response = _send()
+            for attempt in _RETRYING:
+                with attempt:
+                    response = self._http_client().request(method, url, **kwargs)
         except RetryError as exc:
             self.logger.error(
                 "HTTP request failed after retries",
                 extra={"method": method, "url": url, "error": str(exc)},
             )
             raise APIError(f"Failed to call {method} {url} after multiple attempts: {exc}") from exc
-        except httpx.HTTPError as exc:  # pragma: no cover - retry handles most
+        except httpx.HTTPError as exc:
             self.logger.error(
                 "HTTP error during request",
                 extra={"method": method, "url": url, "error": str(exc)},
             )
             raise APIError(f"HTTP error while calling {method} {url}: {exc}") from exc
 
+        if stale is not None and response.status_code == 304:
+            cache.touch(cache_key)
+            if debug:
+                self.logger.debug("HTTP cache revalidated", extra={"method": method, "url": str(response.url)})
+            return stale
         self._raise_for_status(response)
-        self.logger.debug(
-            "HTTP response",
-            extra={
-                "status_code": response.status_code,
-                "url": str(response.url),
-            },
-        )
+        if cache_key is not None:
+            cache.set(cache_key, response)
+        if debug:
+            self.logger.debug(
+                "HTTP response",
+                extra={
+                    "status_code": response.status_code,
+                    "url": str(response.url),
+                },
+            )
         return response
 
+    @contextmanager
+    def _stream(self, method: str, url: str, **kwargs: Any) -> Iterator[httpx.Response]:
+        """
+        Open a streamed response for callers that only need the start of the body.
+
+        Connecting is retried like :meth:`_request`; the body is read lazily and
+        the connection is released when the block exits, even if unread bytes
+        remain. Streamed responses bypass ``response_cache``.
+        """
+
+        kwargs["headers"] = self._request_headers(kwargs.get("headers"))
+        with ExitStack() as stack:
+            try:
+                for attempt in _RETRYING:
+                    with attempt:
+                        response = stack.enter_context(self._http_client().stream(method, url, **kwargs))
+                if not response.is_success:
+                    response.read()
+                self._raise_for_status(response)
+                yield response
+            except RetryError as exc:
+                raise APIError(f"Failed to call {method} {url} after multiple attempts: {exc}") from exc
+            except httpx.HTTPError as exc:
+                raise APIError(f"HTTP error while calling {method} {url}: {exc}") from exc
+
     def _get_json(self, url: str, *, params: Optional[Mapping[str, Any]] = None) -> Any:
         response = self._request("GET", url, params=params)
         try:
-            return response.json()
+            return self._decode_json(response)
         except ValueError as exc:  # pragma: no cover - depends on upstream
             raise APIError(f"Failed to decode JSON from {response.url}: {exc}") from exc
 
@@ -124,12 +378,23 @@ class BaseAPIClient:
         *,
         json_body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, Any]] = None,
     ) -> Any:
-        merged_headers: MutableMapping[str, str] = dict(self.default_headers)
-        if headers:
-            merged_headers.update(headers)
-        response = self._request("POST", url, json=json_body, headers=merged_headers)
+        # ``_request`` layers per-call extras over ``default_headers``.
+        if orjson is not None and json_body is not None:
+            body_headers = {"Content-Type": "application/json", **headers} if headers else _JSON_CONTENT_HEADERS
+            response = self._request(
+                "POST",
+                url,
+                params=params,
+                content=orjson.dumps(json_body, option=orjson.OPT_NON_STR_KEYS),
+                headers=body_headers,
+            )
+        elif headers:
+            response = self._request("POST", url, params=params, json=json_body, headers=headers)
+        else:
+            response = self._request("POST", url, params=params, json=json_body)
         try:
-            return response.json()
+            return self._decode_json(response)
         except ValueError as exc:  # pragma: no cover - depends on upstream
             raise APIError(f"Failed to decode JSON from {response.url}: {exc}") from exc
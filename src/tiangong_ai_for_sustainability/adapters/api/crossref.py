@@ -6,19 +6,27 @@ Reference: https://api.crossref.org/swagger-ui/index.html
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional
+from typing import Any, Dict, Iterable, Iterator, Mapping, MutableMapping, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://api.crossref.org"
 _VERIFICATION_DOI = "10.1038/nphys1170"
+MAX_ROWS = 1000
+# Crossref rejects ``offset`` beyond this value; deeper result sets need cursor paging.
+MAX_OFFSET = 10000
+MAX_CONCURRENT_PAGES = 8
+DOI_BATCH_SIZE = 100
 
 
 class CrossrefClient(BaseAPIClient):
     """Minimal Crossref client for deterministic metadata retrieval."""
 
+    __slots__ = ("mailto",)
+
     def __init__(
         self,
         *,
@@ -27,7 +35,7 @@ class CrossrefClient(BaseAPIClient):
         default_headers: Optional[MutableMapping[str, str]] = None,
         mailto: Optional[str] = None,
     ) -> None:
-        headers: MutableMapping[str, str] = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers: MutableMapping[str, str] = {"User-Agent": DEFAULT_USER_AGENT}
         if default_headers:
             headers.update(default_headers)
         if mailto:
@@ -49,9 +57,12 @@ class CrossrefClient(BaseAPIClient):
         sort: Optional[str] = None,
         order: Optional[str] = None,
         rows: int = 20,
+        offset: Optional[int] = None,
         select: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
-        params: Dict[str, Any] = {"rows": max(1, min(rows, 1000))}
+        params: Dict[str, Any] = {"rows": max(1, min(rows, MAX_ROWS))}
+        if offset:
+            params["offset"] = offset
         if query:
             params["query"] = query
         if filters:
@@ -69,6 +80,89 @@ class CrossrefClient(BaseAPIClient):
             raise APIError("Unexpected payload from Crossref works search.")
         return payload
 
+    def search_works_paginated(
+        self,
+        *,
+        total_rows: int,
+        page_size: int = MAX_ROWS,
+        max_workers: int = MAX_CONCURRENT_PAGES,
+        **search_kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Fetch up to ``total_rows`` works across several pages.
+
+        The first page reports ``total-results``; the remaining pages are
+        requested concurrently (bounded by ``max_workers``) over the pooled
+        client and their items appended in offset order. Offset paging stops at
+        :data:`MAX_OFFSET` results, so larger ``total_rows`` are clamped to it.
+        """
+
+        page_size = max(1, min(page_size, MAX_ROWS))
+        payload = self.search_works(rows=min(page_size, total_rows), **search_kwargs)
+        message = payload.get("message")
+        if not isinstance(message, dict):
+            return payload
+        items = message.get("items")
+        if not isinstance(items, list):
+            return payload
+        total_results = message.get("total-results")
+        target = min(total_rows, MAX_OFFSET)
+        if isinstance(total_results, int):
+            target = min(target, total_results)
+        offsets = range(page_size, target, page_size)
+        if not offsets:
+            return payload
+
+        def fetch_page(offset: int) -> Dict[str, Any]:
+            return self.search_works(rows=min(page_size, target - offset), offset=offset, **search_kwargs)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(offsets)))) as executor:
+            for page in executor.map(fetch_page, offsets):
+                page_message = page.get("message")
+                page_items = page_message.get("items") if isinstance(page_message, dict) else None
+                if isinstance(page_items, list):
+                    items.extend(page_items)
+        return payload
+
+    def get_works_bulk(self, dois: Iterable[str], *, select: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve many DOIs through the ``/works?filter=doi:...`` endpoint.
+
+        DOIs are queried in batches of :data:`DOI_BATCH_SIZE` (keeping URLs
+        short) with batches fetched concurrently. Returns a mapping from each
+        requested DOI to its work record; DOIs unknown to Crossref are omitted.
+        """
+
+        requested: Dict[str, str] = {}
+        for doi in dois:
+            cleaned = doi.strip()
+            if cleaned:
+                requested.setdefault(cleaned.lower(), cleaned)
+        if not requested:
+            return {}
+        keys = list(requested.values())
+        batches = [keys[start : start + DOI_BATCH_SIZE] for start in range(0, len(keys), DOI_BATCH_SIZE)]
+        fields = list(select) if select else None
+        if fields and "DOI" not in fields:
+            fields.append("DOI")
+
+        def fetch_batch(batch: list[str]) -> Dict[str, Any]:
+            return self.search_works(filters={"doi": batch}, rows=len(batch), select=fields)
+
+        works: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, len(batches))) as executor:
+            for payload in executor.map(fetch_batch, batches):
+                message = payload.get("message")
+                items = message.get("items") if isinstance(message, dict) else None
+                if not isinstance(items, list):
+                    raise APIError("Crossref works payload missing 'message.items' list.")
+                for item in items:
+                    doi = item.get("DOI") if isinstance(item, dict) else None
+                    original = requested.get(doi.lower()) if isinstance(doi, str) else None
+                    if original is not None:
+                        works[original] = item
+        return works
+
     def get_work(self, doi: str, *, select: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         # Note: Crossref's works/{doi} route does not accept the `select` parameter.
         payload = self._get_json(f"/works/{doi}", params=self._augment_params({}))
@@ -81,16 +175,15 @@ class CrossrefClient(BaseAPIClient):
 
     @staticmethod
     def _serialise_filters(filters: Mapping[str, Any]) -> str:
-        entries: list[str] = []
-        for key, value in filters.items():
-            if value is None:
-                continue
-            if isinstance(value, (set, list, tuple)):
-                for item in value:
-                    entries.append(f"{key}:{item}")
-            else:
-                entries.append(f"{key}:{value}")
-        return ",".join(entries)
+        return ",".join(entry for key, value in filters.items() for entry in _iter_filter_entries(key, value))
+
+
+def _iter_filter_entries(key: str, value: Any) -> Iterator[str]:
+    if isinstance(value, (set, list, tuple)):
+        for item in value:
+            yield f"{key}:{item}"
+    elif value is not None:
+        yield f"{key}:{value}"
 
 
 @dataclass(slots=True)
@@ -107,6 +200,9 @@ class CrossrefAdapter(DataSourceAdapter):
                 message="Crossref API requires a contact email. Configure crossref.mailto or TIANGONG_CROSSREF_MAILTO.",
                 details={"reason": "missing-mailto"},
             )
+        problem = self.client.preflight() if isinstance(self.client, BaseAPIClient) else None
+        if problem:
+            return VerificationResult(success=False, message=f"Crossref API verification skipped: {problem}")
         try:
             payload = self.client.get_work(_VERIFICATION_DOI, select=["title", "issued"])
         except APIError as exc:
@@ -135,18 +231,9 @@ def _coerce_title(value: Any) -> Optional[str]:
 
 
 def _extract_year(value: Any) -> Optional[int]:
-    if not isinstance(value, dict):
-        return None
-    parts = value.get("date-parts")
-    if not isinstance(parts, list) or not parts:
-        return None
-    first = parts[0]
-    if not isinstance(first, (list, tuple)) or not first:
-        return None
-    year = first[0]
-    if isinstance(year, int):
-        return year
     try:
-        return int(year)
-    except (TypeError, ValueError):
+        parts = value["date-parts"][0]
+        # A bare string here would otherwise be indexed character by character.
+        return int(parts[0]) if isinstance(parts, (list, tuple)) else None
+    except (TypeError, KeyError, IndexError, ValueError):
         return None
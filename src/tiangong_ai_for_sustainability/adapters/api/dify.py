@@ -20,6 +20,8 @@ DEFAULT_TEST_QUERY = "sustainability research evidence"
 class DifyKnowledgeBaseClient(BaseAPIClient):
     """Minimal client for the Dify knowledge base retrieve endpoint."""
 
+    __slots__ = ("api_key",)
+
     DEFAULT_BASE_URL = DEFAULT_BASE_URL
 
     def __init__(
@@ -12,15 +12,18 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://app.dimensions.ai/api/dsl/v2"
 SAMPLE_QUERY = "search publications return publications[id + title] limit 1"
+_SAMPLE_QUERY_BYTES = SAMPLE_QUERY.encode("utf-8")
 
 
 class DimensionsAIClient(BaseAPIClient):
     """Minimal client for the Dimensions DSL endpoint."""
 
+    __slots__ = ("api_key",)
+
     def __init__(
         self,
         *,
@@ -28,7 +31,7 @@ class DimensionsAIClient(BaseAPIClient):
         timeout: float = 20.0,
         api_key: Optional[str] = None,
     ) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
@@ -41,11 +44,11 @@ class DimensionsAIClient(BaseAPIClient):
         response = self._request(
             "POST",
             "",
-            content=SAMPLE_QUERY.encode("utf-8"),
+            content=_SAMPLE_QUERY_BYTES,
             headers={"Content-Type": "text/plain"},
         )
         try:
-            payload = response.json()
+            payload = self._decode_json(response)
         except ValueError as exc:  # pragma: no cover - depends on upstream
             raise APIError(f"Failed to decode Dimensions DSL response: {exc}") from exc
 
@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Mapping, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://catalogue.dataspace.copernicus.eu/resto"
 
@@ -21,8 +21,10 @@ DEFAULT_BASE_URL = "https://catalogue.dataspace.copernicus.eu/resto"
 class CopernicusDataspaceClient(BaseAPIClient):
     """Client for Copernicus Dataspace RESTO metadata search."""
 
+    __slots__ = ()
+
     def __init__(self, *, base_url: str = DEFAULT_BASE_URL, timeout: float = 20.0) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
 
     def search_collection(
@@ -59,11 +61,9 @@ def _extract_first_feature(payload: Mapping[str, Any]) -> Optional[Mapping[str,
     """Return the first GeoJSON feature from a RESTO payload, if available."""
 
     features = payload.get("features")
-    if isinstance(features, list):
-        for feature in features:
-            if isinstance(feature, Mapping):
-                return feature
-    return None
+    if not isinstance(features, list):
+        return None
+    return next((feature for feature in features if isinstance(feature, Mapping)), None)
 
 
 @dataclass(slots=True)
@@ -76,6 +76,10 @@ class CopernicusDataspaceAdapter(DataSourceAdapter):
     verification_product_type: str = "S2MSI1C"
 
     def verify(self) -> VerificationResult:
+        problem = self.client.preflight() if isinstance(self.client, BaseAPIClient) else None
+        if problem:
+            return VerificationResult(success=False, message=f"Copernicus Dataspace verification skipped: {problem}")
+
         try:
             payload = self.client.search_collection(
                 collection=self.verification_collection,
@@ -8,7 +8,8 @@ surfacing clear guidance for operators.
 
 from __future__ import annotations
 
-from typing import Optional
+import os
+from typing import Any, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
 
@@ -16,17 +17,27 @@ from ..base import DataSourceAdapter, VerificationResult
 class LicensedESGAdapter(DataSourceAdapter):
     """Base class for credential-gated ESG data providers."""
 
+    __slots__ = ("api_key",)
+
     source_id: str
     display_name: str
     env_var: str
 
+    _missing_message: str
+    _present_message: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._missing_message = (
+            f"{cls.display_name} credentials are not configured. Add an [" f"{cls.source_id}] api_key entry to .secrets/secrets.toml or set " f"{cls.env_var} before running this command."
+        )
+        cls._present_message = f"{cls.display_name} credentials detected; upstream access requires licensed ingestion workflows."
+
     def __init__(self, *, api_key: Optional[str] = None) -> None:
-        self.api_key = api_key
+        self.api_key = api_key or os.getenv(self.env_var) or None
 
     def _missing_credentials_message(self) -> str:
-        return (
-            f"{self.display_name} credentials are not configured. Add an [" f"{self.source_id}] api_key entry to .secrets/secrets.toml or set " f"{self.env_var} before running this command."
-        )
+        return self._missing_message
 
     def verify(self) -> VerificationResult:
         if not self.api_key:
@@ -37,42 +48,54 @@ class LicensedESGAdapter(DataSourceAdapter):
 
         return VerificationResult(
             success=True,
-            message=f"{self.display_name} credentials detected; upstream access requires licensed ingestion workflows.",
+            message=self._present_message,
             details={"credential_present": True},
         )
 
 
 class CdpClimateAdapter(LicensedESGAdapter):
+    __slots__ = ()
+
     source_id = "cdp_climate"
     display_name = "CDP Climate Disclosure Dashboard"
     env_var = "TIANGONG_CDP_API_KEY"
 
 
 class LsegESGAdapter(LicensedESGAdapter):
+    __slots__ = ()
+
     source_id = "lseg_esg"
     display_name = "LSEG Refinitiv ESG Data"
     env_var = "TIANGONG_LSEG_API_KEY"
 
 
 class MsciESGAdapter(LicensedESGAdapter):
+    __slots__ = ()
+
     source_id = "msci_esg"
     display_name = "MSCI ESG Research"
     env_var = "TIANGONG_MSCI_API_KEY"
 
 
 class SustainalyticsAdapter(LicensedESGAdapter):
+    __slots__ = ()
+
     source_id = "sustainalytics"
     display_name = "Sustainalytics ESG Risk Ratings"
     env_var = "TIANGONG_SUSTAINALYTICS_API_KEY"
 
 
 class SpGlobalESGAdapter(LicensedESGAdapter):
+    __slots__ = ()
+
     source_id = "sp_global_esg"
     display_name = "S&P Global Sustainable1"
     env_var = "TIANGONG_SPGLOBAL_API_KEY"
 
 
 class IssESGAdapter(LicensedESGAdapter):
+    __slots__ = ()
+
     source_id = "iss_esg"
     display_name = "ISS ESG Data"
     env_var = "TIANGONG_ISS_API_KEY"
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://api.github.com"
 
@@ -20,6 +20,8 @@ DEFAULT_BASE_URL = "https://api.github.com"
 class GitHubTopicsClient(BaseAPIClient):
     """Wrapper around GitHub's search API for topic discovery."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -29,7 +31,7 @@ class GitHubTopicsClient(BaseAPIClient):
     ) -> None:
         headers = {
             "Accept": "application/vnd.github+json",
-            "User-Agent": "tiangong-ai-sustainability-cli",
+            "User-Agent": DEFAULT_USER_AGENT,
         }
         resolved_token = token or os.getenv("GITHUB_TOKEN")
         if resolved_token:
@@ -9,10 +9,10 @@ reports the first dataset identifier to confirm availability.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://www.ilo.org/ilostat/sdmx/ws/public/sdmxapi/rest/v2"
 
@@ -20,6 +20,8 @@ DEFAULT_BASE_URL = "https://www.ilo.org/ilostat/sdmx/ws/public/sdmxapi/rest/v2"
 class ILOSTATClient(BaseAPIClient):
     """Client for the ILOSTAT SDMX REST API."""
 
+    __slots__ = ("cookies",)
+
     def __init__(
         self,
         *,
@@ -29,12 +31,14 @@ class ILOSTATClient(BaseAPIClient):
     ) -> None:
         headers = {
             "Accept": "application/json",
-            "User-Agent": "tiangong-ai-sustainability-cli",
+            "User-Agent": DEFAULT_USER_AGENT,
         }
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
         self.cookies: Optional[Dict[str, str]] = dict(cookies) if cookies else None
 
-    def list_datasets(self) -> List[Mapping[str, Any]]:
+    def list_datasets(self, *, limit: Optional[int] = None) -> List[Mapping[str, Any]]:
+        """Return structured catalogue entries, stopping after ``limit`` when given."""
+
         try:
             response = self._request(
                 "GET",
@@ -52,7 +56,7 @@ class ILOSTATClient(BaseAPIClient):
             raise
 
         try:
-            payload = response.json()
+            payload = self._decode_json(response)
         except ValueError as exc:
             body = response.text
             if "Just a moment" in body:
@@ -74,26 +78,33 @@ class ILOSTATClient(BaseAPIClient):
         for entry in datasets:
             if isinstance(entry, Mapping):
                 results.append(entry)
+                if limit is not None and len(results) >= limit:
+                    break
 
         if not results:
             raise APIError("ILOSTAT catalogue returned no structured dataset entries.")
         return results
 
 
-def _dataset_identifier(entry: Mapping[str, Any]) -> Optional[str]:
-    for key in ("id", "datasetCode", "datasetID", "code", "Identifier"):
-        value = entry.get(key)
-        if isinstance(value, str) and value:
+_IDENTIFIER_KEYS = ("id", "datasetCode", "datasetID", "code", "Identifier")
+_LABEL_KEYS = ("name", "description", "Title", "title")
+
+
+def _first_str(entry: Mapping[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    get = entry.get
+    for key in keys:
+        value = get(key)
+        if type(value) is str and value:
             return value
     return None
 
 
+def _dataset_identifier(entry: Mapping[str, Any]) -> Optional[str]:
+    return _first_str(entry, _IDENTIFIER_KEYS)
+
+
 def _dataset_label(entry: Mapping[str, Any]) -> Optional[str]:
-    for key in ("name", "description", "Title", "title"):
-        value = entry.get(key)
-        if isinstance(value, str) and value:
-            return value
-    return None
+    return _first_str(entry, _LABEL_KEYS)
 
 
 @dataclass(slots=True)
@@ -105,7 +116,7 @@ class ILOSTATAdapter(DataSourceAdapter):
 
     def verify(self) -> VerificationResult:
         try:
-            datasets = self.client.list_datasets()
+            datasets = self.client.list_datasets(limit=1)
         except APIError as exc:
             return VerificationResult(success=False, message=f"ILOSTAT verification failed: {exc}")
 
@@ -10,23 +10,27 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://climatedata.imf.org"
 EXPECTED_TITLE = "Macroeconomic Climate Indicators Dashboard"
+_EXPECTED_TITLE_BYTES = EXPECTED_TITLE.encode("utf-8")
+# The title sits in the document head; servers that honour ranges send only this prefix.
+_HOMEPAGE_RANGE = "bytes=0-65535"
 
 
 class IMFClimateClient(BaseAPIClient):
     """HTTP client for the IMF climate dashboard front-end."""
 
+    __slots__ = ()
+
     def __init__(self, *, base_url: str = DEFAULT_BASE_URL, timeout: float = 20.0) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
 
     def fetch_homepage_title(self) -> str:
-        response = self._request("GET", "/")
-        text = response.text
-        if EXPECTED_TITLE not in text:
+        response = self._request("GET", "/", headers={"Range": _HOMEPAGE_RANGE})
+        if _EXPECTED_TITLE_BYTES not in response.content:
             raise APIError("IMF climate dashboard response did not include the expected title.")
         return EXPECTED_TITLE
 
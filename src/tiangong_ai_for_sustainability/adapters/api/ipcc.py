@@ -13,7 +13,7 @@ from typing import Mapping
 
 from ..base import DataSourceAdapter, VerificationResult
 from .base import APIError
-from .zenodo import ZenodoCommunityClient, extract_record_doi
+from .zenodo import ZenodoCommunityClient, extract_record_doi, extract_record_title
 
 
 @dataclass(slots=True)
@@ -34,7 +34,7 @@ class IPCCDDCAdapter(DataSourceAdapter):
             return VerificationResult(success=False, message="IPCC DDC community returned no records.")
 
         record: Mapping[str, object] = records[0]
-        title = self.client.fetch_latest_title(self.community_id)
+        title = extract_record_title(record)
         doi = extract_record_doi(record)
 
         details = {}
@@ -9,10 +9,12 @@ credentials to be sourced from the execution context or the standard
 
 from __future__ import annotations
 
+import functools
 import importlib
 import os
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
 
 from ..base import AdapterError, DataSourceAdapter, VerificationResult
 
@@ -21,6 +23,13 @@ class KaggleAPIError(AdapterError):
     """Raised when Kaggle API calls fail or the SDK is unavailable."""
 
 
+# ``KaggleApi`` instances keyed by explicit credentials, shared so the SDK reads
+# ``kaggle.json`` and authenticates once per process rather than once per client.
+_SHARED_APIS: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+_AUTHENTICATED: Set[Tuple[Optional[str], Optional[str]]] = set()
+_SHARED_APIS_LOCK = threading.Lock()
+
+
 @dataclass(slots=True)
 class KaggleClient:
     """
@@ -50,10 +59,14 @@ class KaggleClient:
         if self._authenticated:
             return
         api = self._ensure_api()
-        try:
-            api.authenticate()
-        except Exception as exc:  # pragma: no cover - library raises rich error types
-            raise KaggleAPIError(f"Failed to authenticate with Kaggle API: {exc}") from exc
+        credentials = (self.username, self.key)
+        with _SHARED_APIS_LOCK:
+            if credentials not in _AUTHENTICATED:
+                try:
+                    api.authenticate()
+                except Exception as exc:  # pragma: no cover - library raises rich error types
+                    raise KaggleAPIError(f"Failed to authenticate with Kaggle API: {exc}") from exc
+                _AUTHENTICATED.add(credentials)
         self._authenticated = True
 
     def dataset_status(self, dataset_ref: str) -> str:
@@ -133,43 +146,50 @@ class KaggleClient:
     def _ensure_api(self) -> Any:
         if self._api is not None:
             return self._api
-        self._apply_credentials()
-        try:
-            module = importlib.import_module("kaggle.api.kaggle_api_extended")
-        except ImportError as exc:  # pragma: no cover - depends on runtime environment
-            raise KaggleAPIError("kaggle package is not installed. Install it with 'uv add kaggle==1.7.4.5'.") from exc
-        except Exception as exc:  # pragma: no cover - e.g. missing credentials during import
-            raise KaggleAPIError(f"Failed to import Kaggle API module: {exc}") from exc
-
-        api_cls = getattr(module, "KaggleApi", None)
-        if api_cls is None:
-            raise KaggleAPIError("Installed kaggle package does not expose KaggleApi class.")
-
-        try:
-            api = api_cls()
-        except Exception as exc:  # pragma: no cover - instantiation errors are upstream-specific
-            raise KaggleAPIError(f"Failed to initialise Kaggle API client: {exc}") from exc
+        credentials = (self.username, self.key)
+        with _SHARED_APIS_LOCK:
+            api = _SHARED_APIS.get(credentials)
+            if api is None:
+                self._apply_credentials()
+                api_cls = _load_kaggle_api_cls()
+                try:
+                    api = api_cls()
+                except Exception as exc:  # pragma: no cover - instantiation errors are upstream-specific
+                    raise KaggleAPIError(f"Failed to initialise Kaggle API client: {exc}") from exc
+                _SHARED_APIS[credentials] = api
 
         self._api = api
         return api
 
 
-def _extract_dataset_details(payload: Any) -> tuple[Optional[str], Optional[str]]:
-    ref: Optional[str] = None
-    title: Optional[str] = None
+@functools.lru_cache(maxsize=1)
+def _load_kaggle_api_cls() -> Any:
+    """Import the Kaggle SDK once per process and return its ``KaggleApi`` class."""
+
+    try:
+        module = importlib.import_module("kaggle.api.kaggle_api_extended")
+    except ImportError as exc:  # pragma: no cover - depends on runtime environment
+        raise KaggleAPIError("kaggle package is not installed. Install it with 'uv add kaggle==1.7.4.5'.") from exc
+    except Exception as exc:  # pragma: no cover - e.g. missing credentials during import
+        raise KaggleAPIError(f"Failed to import Kaggle API module: {exc}") from exc
+
+    api_cls = getattr(module, "KaggleApi", None)
+    if api_cls is None:
+        raise KaggleAPIError("Installed kaggle package does not expose KaggleApi class.")
+    return api_cls
 
+
+def _extract_dataset_details(payload: Any) -> tuple[Optional[str], Optional[str]]:
     if isinstance(payload, dict):
-        ref = payload.get("ref") or payload.get("id")
-        raw_title = payload.get("title") or payload.get("name")
-        if isinstance(raw_title, str) and raw_title:
-            title = raw_title
+        get = payload.get
     else:
-        ref = getattr(payload, "ref", None) or getattr(payload, "id", None)
-        raw_title = getattr(payload, "title", None) or getattr(payload, "name", None)
-        if isinstance(raw_title, str) and raw_title:
-            title = raw_title
 
-    return ref, title
+        def get(name: str) -> Any:
+            return getattr(payload, name, None)
+
+    ref = get("ref") or get("id")
+    title = get("title") or get("name")
+    return (ref if type(ref) is str else None), (title if type(title) is str and title else None)
 
 
 @dataclass(slots=True)
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://api.lens.org"
 
@@ -20,6 +20,8 @@ DEFAULT_BASE_URL = "https://api.lens.org"
 class LensOrgClient(BaseAPIClient):
     """Minimalistic Lens.org client for verification purposes."""
 
+    __slots__ = ("api_key",)
+
     def __init__(
         self,
         *,
@@ -27,7 +29,7 @@ class LensOrgClient(BaseAPIClient):
         timeout: float = 20.0,
         api_key: Optional[str] = None,
     ) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         if api_key:
             headers["Authorization"] = api_key
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
@@ -10,10 +10,10 @@ Earthdata Login credentials are configured.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://cmr.earthdata.nasa.gov"
 
@@ -21,8 +21,10 @@ DEFAULT_BASE_URL = "https://cmr.earthdata.nasa.gov"
 class NasaEarthdataClient(BaseAPIClient):
     """Thin client for NASA Earthdata CMR metadata search."""
 
+    __slots__ = ()
+
     def __init__(self, *, base_url: str = DEFAULT_BASE_URL, timeout: float = 20.0) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
 
     def search_collections(self, *, keyword: str, page_size: int = 5) -> Dict[str, Any]:
@@ -51,15 +53,12 @@ class NasaEarthdataClient(BaseAPIClient):
 def _extract_first_entry(payload: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
     """Return the first collection entry from a CMR payload, if present."""
 
-    feed = payload.get("feed")
-    if not isinstance(feed, Mapping):
+    try:
+        entry = payload["feed"]["entry"][0]
+    except (KeyError, IndexError, TypeError):
         return None
-    entries = feed.get("entry")
-    if isinstance(entries, Iterable):
-        for entry in entries:
-            if isinstance(entry, Mapping):
-                return entry
-    return None
+    # ``verify`` reads fields with ``.get``, so the entry itself must still be a mapping.
+    return entry if isinstance(entry, Mapping) else None
 
 
 @dataclass(slots=True)
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Mapping, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://opensupplyhub.org"
 
@@ -20,6 +20,8 @@ DEFAULT_BASE_URL = "https://opensupplyhub.org"
 class OpenSupplyHubClient(BaseAPIClient):
     """HTTP client for the Open Supply Hub facilities API."""
 
+    __slots__ = ("api_key",)
+
     def __init__(
         self,
         *,
@@ -27,7 +29,7 @@ class OpenSupplyHubClient(BaseAPIClient):
         timeout: float = 20.0,
         api_key: Optional[str] = None,
     ) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         if api_key:
             headers["Authorization"] = f"Token {api_key}"
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
@@ -36,9 +38,9 @@ class OpenSupplyHubClient(BaseAPIClient):
     def list_facilities(self, *, limit: int = 5) -> Dict[str, Any]:
         params = {"limit": max(1, min(limit, 50))}
         payload = self._get_json("/api/facilities/", params=params)
-        if not isinstance(payload, Mapping):
+        if not isinstance(payload, dict):
             raise APIError("Unexpected payload type from Open Supply Hub facilities endpoint.")
-        return dict(payload)
+        return payload
 
 
 @dataclass(slots=True)
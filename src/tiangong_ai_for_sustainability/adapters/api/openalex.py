@@ -6,18 +6,22 @@ Reference: https://docs.openalex.org/api-entities/works
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Iterator, Mapping, MutableMapping, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://api.openalex.org"
+MAX_CONCURRENT_SHARDS = 8
 
 
 class OpenAlexClient(BaseAPIClient):
     """Minimal OpenAlex client for deterministic literature retrieval."""
 
+    __slots__ = ("mailto",)
+
     def __init__(
         self,
         *,
@@ -26,7 +30,7 @@ class OpenAlexClient(BaseAPIClient):
         default_headers: Optional[MutableMapping[str, str]] = None,
         mailto: Optional[str] = None,
     ) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         if default_headers:
             headers.update(default_headers)
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
@@ -42,21 +46,9 @@ class OpenAlexClient(BaseAPIClient):
         cursor: str = "*",
         per_page: int = 200,
     ) -> Dict[str, Any]:
-        params: Dict[str, Any] = {"cursor": cursor, "per-page": max(1, min(per_page, 200))}
-        if search:
-            params["search"] = search
-        if filters:
-            params["filter"] = self._serialise_filters(filters)
-        if sort:
-            params["sort"] = sort
-        if select:
-            params["select"] = ",".join(select)
-        if self.mailto:
-            params.setdefault("mailto", self.mailto)
-        payload = self._get_json("/works", params=params)
-        if not isinstance(payload, dict):
-            raise APIError("Unexpected payload from OpenAlex works search.")
-        return payload
+        params = self._works_params(search=search, filters=filters, sort=sort, select=select, per_page=per_page)
+        params["cursor"] = cursor
+        return self._fetch_works(params)
 
     def iterate_works(
         self,
@@ -68,17 +60,13 @@ class OpenAlexClient(BaseAPIClient):
         per_page: int = 200,
         max_pages: Optional[int] = None,
     ) -> Iterator[Dict[str, Any]]:
+        # Filters and selections are serialised once; only the cursor changes between pages.
+        params = self._works_params(search=search, filters=filters, sort=sort, select=select, per_page=per_page)
         cursor = "*"
         pages = 0
         while True:
-            payload = self.search_works(
-                search=search,
-                filters=filters,
-                sort=sort,
-                select=select,
-                cursor=cursor,
-                per_page=per_page,
-            )
+            params["cursor"] = cursor
+            payload = self._fetch_works(params)
             results = payload.get("results") or []
             if not isinstance(results, list):
                 raise APIError("OpenAlex works payload missing 'results' list.")
@@ -99,6 +87,72 @@ class OpenAlexClient(BaseAPIClient):
 
             cursor = str(next_cursor)
 
+    def iterate_works_sharded(
+        self,
+        *,
+        shard_filter_key: str,
+        shard_values: Sequence[Any],
+        filters: Optional[Mapping[str, Any]] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        select: Optional[Iterable[str]] = None,
+        per_page: int = 200,
+        max_pages: Optional[int] = None,
+        max_workers: int = MAX_CONCURRENT_SHARDS,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Walk one cursor per shard value concurrently and yield works shard by shard.
+
+        Each shard adds ``shard_filter_key:<value>`` to ``filters`` (for example
+        ``publication_year`` with one year per shard) and is paged independently
+        over the pooled client, bounded by ``max_workers``. Results are yielded
+        in ``shard_values`` order so output stays deterministic; ``max_pages``
+        applies per shard.
+        """
+
+        select = tuple(select) if select else None
+
+        def walk(value: Any) -> List[Dict[str, Any]]:
+            shard_filters = {**(filters or {}), shard_filter_key: value}
+            return list(self.iterate_works(search=search, filters=shard_filters, sort=sort, select=select, per_page=per_page, max_pages=max_pages))
+
+        if not shard_values:
+            return
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(shard_values))))
+        try:
+            for works in executor.map(walk, shard_values):
+                yield from works
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _works_params(
+        self,
+        *,
+        search: Optional[str],
+        filters: Optional[Mapping[str, Any]],
+        sort: Optional[str],
+        select: Optional[Iterable[str]],
+        per_page: int,
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"per-page": max(1, min(per_page, 200))}
+        if search:
+            params["search"] = search
+        if filters:
+            params["filter"] = self._serialise_filters(filters)
+        if sort:
+            params["sort"] = sort
+        if select:
+            params["select"] = ",".join(select)
+        if self.mailto:
+            params.setdefault("mailto", self.mailto)
+        return params
+
+    def _fetch_works(self, params: Mapping[str, Any]) -> Dict[str, Any]:
+        payload = self._get_json("/works", params=params)
+        if not isinstance(payload, dict):
+            raise APIError("Unexpected payload from OpenAlex works search.")
+        return payload
+
     def get_work(self, work_id: str, *, select: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         params = {"select": ",".join(select)} if select else {}
         if self.mailto:
@@ -13,14 +13,17 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://osdg.ai/api"
+SAMPLE_TEXT = "Sustainable development requires coordinated economic, social, and environmental policies to tackle climate change while protecting vulnerable populations and biodiversity."
 
 
 class OSDGClient(BaseAPIClient):
     """Minimal client for the public OSDG classification endpoint."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -28,7 +31,7 @@ class OSDGClient(BaseAPIClient):
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = 30.0,
     ) -> None:
-        headers = {"Accept": "application/json", "User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"Accept": "application/json", "User-Agent": DEFAULT_USER_AGENT}
         if api_token:
             headers["Authorization"] = f"Bearer {api_token}"
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
@@ -50,9 +53,7 @@ class OSDGAdapter(DataSourceAdapter):
     source_id: str = "osdg_api"
     client: OSDGClient = field(default_factory=OSDGClient)
 
-    SAMPLE_TEXT: str = (
-        "Sustainable development requires coordinated economic, social, and environmental policies to " "tackle climate change while protecting vulnerable populations and biodiversity."
-    )
+    SAMPLE_TEXT: str = SAMPLE_TEXT
 
     def verify(self) -> VerificationResult:
         try:
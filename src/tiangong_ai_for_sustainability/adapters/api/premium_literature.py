@@ -7,7 +7,7 @@ For now we detect API key configuration to surface clear guidance in the CLI.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
 
@@ -15,15 +15,25 @@ from ..base import DataSourceAdapter, VerificationResult
 class CredentialPresenceAdapter(DataSourceAdapter):
     """Base adapter that validates the presence of an API key."""
 
+    __slots__ = ("api_key",)
+
     source_id: str
     display_name: str
     env_var: str
 
+    _missing_text: str
+    _present_text: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._missing_text = f"{cls.display_name} API credentials are not configured. Add an [{cls.source_id}] api_key " f"entry to .secrets/secrets.toml or set {cls.env_var}."
+        cls._present_text = f"{cls.display_name} API credentials detected. Licensed data ingestion remains pending."
+
     def __init__(self, *, api_key: Optional[str] = None) -> None:
         self.api_key = api_key
 
     def _missing_message(self) -> str:
-        return f"{self.display_name} API credentials are not configured. Add an [{self.source_id}] api_key " f"entry to .secrets/secrets.toml or set {self.env_var}."
+        return self._missing_text
 
     def verify(self) -> VerificationResult:
         if not self.api_key:
@@ -31,18 +41,22 @@ class CredentialPresenceAdapter(DataSourceAdapter):
 
         return VerificationResult(
             success=True,
-            message=f"{self.display_name} API credentials detected. Licensed data ingestion remains pending.",
+            message=self._present_text,
             details={"credential_present": True},
         )
 
 
 class AcmDigitalLibraryAdapter(CredentialPresenceAdapter):
+    __slots__ = ()
+
     source_id = "acm_digital_library"
     display_name = "ACM Digital Library"
     env_var = "TIANGONG_ACM_API_KEY"
 
 
 class ScopusAdapter(CredentialPresenceAdapter):
+    __slots__ = ()
+
     source_id = "scopus"
     display_name = "Elsevier Scopus"
     env_var = "TIANGONG_SCOPUS_API_KEY"
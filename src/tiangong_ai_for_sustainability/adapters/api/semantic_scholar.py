@@ -10,21 +10,24 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://api.semanticscholar.org/graph/v1"
+BATCH_SIZE = 500
 
 
 class SemanticScholarClient(BaseAPIClient):
     """Minimal Semantic Scholar client covering search and metadata retrieval."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = 20.0,
     ) -> None:
-        default_headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        default_headers = {"User-Agent": DEFAULT_USER_AGENT}
         if api_key:
             default_headers["x-api-key"] = api_key
         super().__init__(base_url=base_url, timeout=timeout, default_headers=default_headers)
@@ -56,6 +59,23 @@ class SemanticScholarClient(BaseAPIClient):
             raise APIError("Unexpected payload for Semantic Scholar paper lookup.")
         return data
 
+    def get_papers(self, paper_ids: List[str], *, fields: Optional[List[str]] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve many papers through ``/paper/batch``, one POST per ``BATCH_SIZE`` identifiers.
+
+        The result is aligned with ``paper_ids``; unknown identifiers map to ``None``.
+        """
+
+        params = {"fields": ",".join(fields)} if fields else None
+        papers: List[Optional[Dict[str, Any]]] = []
+        for start in range(0, len(paper_ids), BATCH_SIZE):
+            chunk = paper_ids[start : start + BATCH_SIZE]
+            data = self._post_json("/paper/batch", json_body={"ids": chunk}, params=params)
+            if not isinstance(data, list) or len(data) != len(chunk):
+                raise APIError("Unexpected payload for Semantic Scholar batch lookup.")
+            papers.extend(item if isinstance(item, dict) else None for item in data)
+        return papers
+
 
 @dataclass(slots=True)
 class SemanticScholarAdapter(DataSourceAdapter):
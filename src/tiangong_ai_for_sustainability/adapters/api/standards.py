@@ -10,19 +10,46 @@ the heavier ingestion steps.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
 
 from ..base import DataSourceAdapter, VerificationResult
 from .base import APIError, BaseAPIClient
 
+GRI_MARKER = "GRI Standards"
+GHG_MARKER = "Calculation Tools"
+
 
 class StandardsLandingClient(BaseAPIClient):
     """Generic client that issues lightweight GET requests for standards landing pages."""
 
+    __slots__ = ()
+
     def fetch_page(self, path: str = "/") -> str:
         response = self._request("GET", path)
         return response.text
 
+    def contains_marker(self, path: str, marker: str, *, max_bytes: int = 65536) -> bool:
+        """
+        Stream ``path`` and report whether ``marker`` appears in its first ``max_bytes``.
+
+        The connection is released as soon as the marker is found, so landing
+        page checks avoid downloading and decoding the full HTML document.
+        """
+
+        needle = marker.encode("utf-8")
+        overlap = len(needle) - 1
+        tail = b""
+        seen = 0
+        with self._stream("GET", path) as response:
+            for chunk in response.iter_bytes():
+                window = tail + chunk
+                if needle in window:
+                    return True
+                seen += len(chunk)
+                if seen >= max_bytes:
+                    break
+                tail = window[-overlap:] if overlap else b""
+        return False
+
 
 @dataclass(slots=True)
 class GriTaxonomyAdapter(DataSourceAdapter):
@@ -34,19 +61,14 @@ class GriTaxonomyAdapter(DataSourceAdapter):
 
     def verify(self) -> VerificationResult:
         try:
-            content = self.client.fetch_page(self.verification_path)
+            found = self.client.contains_marker(self.verification_path, GRI_MARKER)
         except APIError as exc:
             return VerificationResult(
                 success=False,
                 message=f"GRI taxonomy verification failed: {exc}",
             )
 
-        snippet: Optional[str] = None
-        marker = "GRI Standards"
-        if marker in content:
-            snippet = marker
-
-        details = {"marker": snippet} if snippet else None
+        details = {"marker": GRI_MARKER} if found else None
         return VerificationResult(
             success=True,
             message="GRI taxonomy landing page reachable.",
@@ -64,19 +86,14 @@ class GhgProtocolWorkbooksAdapter(DataSourceAdapter):
 
     def verify(self) -> VerificationResult:
         try:
-            content = self.client.fetch_page(self.verification_path)
+            found = self.client.contains_marker(self.verification_path, GHG_MARKER)
         except APIError as exc:
             return VerificationResult(
                 success=False,
                 message=f"GHG protocol workbooks verification failed: {exc}",
             )
 
-        snippet: Optional[str] = None
-        marker = "Calculation Tools"
-        if marker in content:
-            snippet = marker
-
-        details = {"marker": snippet} if snippet else None
+        details = {"marker": GHG_MARKER} if found else None
         return VerificationResult(
             success=True,
             message="GHG protocol calculation tools page reachable.",
@@ -9,33 +9,45 @@ confirm availability.
 from __future__ import annotations
 
 import csv
-import io
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Iterable, Iterator
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://raw.githubusercontent.com"
 DATASET_PATH = "/datasets/corruption-perceptions-index/master/data/cpi.csv"
 
 
+def _iter_csv_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Re-split decoded text chunks on ``\\n``, keeping line endings so quoted newlines reach :mod:`csv` intact."""
+
+    pending = ""
+    for chunk in chunks:
+        *lines, pending = (pending + chunk).split("\n")
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+
 class TransparencyCPIClient(BaseAPIClient):
     """Client for the mirrored Transparency International CPI dataset."""
 
+    __slots__ = ()
+
     def __init__(self, *, base_url: str = DEFAULT_BASE_URL, timeout: float = 30.0) -> None:
-        headers = {"User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"User-Agent": DEFAULT_USER_AGENT}
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
 
     def fetch_sample_row(self) -> Dict[str, str]:
-        response = self._request("GET", DATASET_PATH)
-        text = response.text
-        stream = io.StringIO(text)
-        reader = csv.DictReader(stream)
-        try:
-            row = next(reader)
-        except StopIteration as exc:
-            raise APIError("Transparency International CPI dataset returned no rows.") from exc
+        # Only the header and first record are read; the connection is released without the rest of the CSV.
+        with self._stream("GET", DATASET_PATH) as response:
+            reader = csv.DictReader(_iter_csv_lines(response.iter_text()))
+            try:
+                row = next(reader)
+            except StopIteration as exc:
+                raise APIError("Transparency International CPI dataset returned no rows.") from exc
         if not isinstance(row, dict):
             raise APIError("Unexpected row structure in CPI dataset.")
         return row
@@ -18,6 +18,8 @@ DEFAULT_BASE_URL = "https://unstats.un.org/SDGAPI/v1"
 class UNSDGClient(BaseAPIClient):
     """Lightweight wrapper around the UNSD SDG v1 API."""
 
+    __slots__ = ()
+
     def __init__(self, base_url: str = DEFAULT_BASE_URL, timeout: float = 20.0) -> None:
         super().__init__(base_url=base_url, timeout=timeout)
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Any, List, Mapping, Optional
 
 from ..base import DataSourceAdapter, VerificationResult
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://query.wikidata.org"
 SAMPLE_QUERY = """
@@ -23,10 +23,12 @@ LIMIT 1
 class WikidataClient(BaseAPIClient):
     """HTTP client for the Wikidata SPARQL endpoint."""
 
+    __slots__ = ()
+
     def __init__(self, *, base_url: str = DEFAULT_BASE_URL, timeout: float = 20.0) -> None:
         headers = {
             "Accept": "application/sparql-results+json",
-            "User-Agent": "tiangong-ai-sustainability-cli",
+            "User-Agent": DEFAULT_USER_AGENT,
         }
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
 
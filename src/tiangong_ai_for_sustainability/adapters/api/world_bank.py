@@ -21,6 +21,8 @@ _VERIFICATION_INDICATOR = "EN.ATM.CO2E.PC"
 class WorldBankClient(BaseAPIClient):
     """Minimal client for the World Bank v2 REST API."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
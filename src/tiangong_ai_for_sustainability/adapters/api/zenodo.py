@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from typing import Any, List, Mapping, Optional
 
-from .base import APIError, BaseAPIClient
+from .base import DEFAULT_USER_AGENT, APIError, BaseAPIClient
 
 DEFAULT_BASE_URL = "https://zenodo.org/api"
 
@@ -18,8 +18,10 @@ DEFAULT_BASE_URL = "https://zenodo.org/api"
 class ZenodoCommunityClient(BaseAPIClient):
     """Minimal wrapper around the Zenodo records search endpoint."""
 
+    __slots__ = ()
+
     def __init__(self, *, base_url: str = DEFAULT_BASE_URL, timeout: float = 20.0) -> None:
-        headers = {"Accept": "application/json", "User-Agent": "tiangong-ai-sustainability-cli"}
+        headers = {"Accept": "application/json", "User-Agent": DEFAULT_USER_AGENT}
         super().__init__(base_url=base_url, timeout=timeout, default_headers=headers)
 
     def list_recent_records(self, community_id: str, *, size: int = 1) -> List[Mapping[str, Any]]:
@@ -51,14 +53,19 @@ class ZenodoCommunityClient(BaseAPIClient):
         records = self.list_recent_records(community_id=community_id, size=1)
         if not records:
             return None
-        record = records[0]
-        metadata = record.get("metadata")
-        if isinstance(metadata, Mapping):
-            title = metadata.get("title")
-            if isinstance(title, str):
-                return title
-        title = record.get("title")
-        return title if isinstance(title, str) else None
+        return extract_record_title(records[0])
+
+
+def extract_record_title(record: Mapping[str, Any]) -> Optional[str]:
+    """Return the record title, preferring ``metadata.title``."""
+
+    metadata = record.get("metadata")
+    if isinstance(metadata, Mapping):
+        title = metadata.get("title")
+        if isinstance(title, str):
+            return title
+    title = record.get("title")
+    return title if isinstance(title, str) else None
 
 
 def extract_record_doi(record: Mapping[str, Any]) -> Optional[str]:
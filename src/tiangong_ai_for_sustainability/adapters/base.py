@@ -41,6 +41,9 @@ class VerificationResult:
 class DataSourceAdapter(Protocol):
     """Protocol implemented by all data source adapters."""
 
+    # Empty slots keep ``slots=True`` adapters free of a per-instance ``__dict__``.
+    __slots__ = ()
+
     def verify(self) -> VerificationResult:
         """Perform a lightweight connectivity check."""
 
@@ -5,7 +5,7 @@ Helpers for resolving data source adapters in CLI contexts.
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from ..adapters import ChartMCPAdapter, DataSourceAdapter
 from ..adapters.api import (
@@ -188,53 +188,54 @@ def resolve_adapter(source_id: str, context: ExecutionContext) -> Optional[DataS
         if isinstance(raw_model, dict):
             dify_retrieval_model = raw_model
 
-    adapters = (
-        GridIntensityCLIAdapter(),
-        GoogleEarthEngineCLIAdapter(),
-        IPCCDDCAdapter(client=ZenodoCommunityClient()),
-        IPBESAdapter(client=ZenodoCommunityClient()),
-        UNSDGAdapter(client=UNSDGClient()),
-        SemanticScholarAdapter(client=SemanticScholarClient(api_key=semantic_key)),
-        OpenAlexAdapter(client=OpenAlexClient(mailto=openalex_mailto)),
-        ILOSTATAdapter(client=ILOSTATClient(cookies=ilostat_cookies)),
-        IMFClimateAdapter(client=IMFClimateClient()),
-        TransparencyCPIAdapter(client=TransparencyCPIClient()),
-        WikidataAdapter(client=WikidataClient()),
-        WorldBankAdapter(client=WorldBankClient()),
-        ArxivAdapter(client=ArxivClient()),
-        GitHubTopicsAdapter(client=GitHubTopicsClient(token=github_token)),
-        OSDGAdapter(client=OSDGClient(api_token=osdg_token)),
-        CrossrefAdapter(client=CrossrefClient(mailto=crossref_mailto)),
-        KaggleAdapter(client=KaggleClient(username=kaggle_username, key=kaggle_key)),
-        DimensionsAIAdapter(client=DimensionsAIClient(api_key=dimensions_key)),
-        LensOrgAdapter(client=LensOrgClient(api_key=lens_key)),
-        OpenSupplyHubAdapter(client=OpenSupplyHubClient(api_key=open_supply_key)),
-        CdpClimateAdapter(api_key=cdp_key),
-        LsegESGAdapter(api_key=lseg_key),
-        MsciESGAdapter(api_key=msci_key),
-        SustainalyticsAdapter(api_key=sustainalytics_key),
-        SpGlobalESGAdapter(api_key=spglobal_key),
-        IssESGAdapter(api_key=iss_key),
-        AcmDigitalLibraryAdapter(api_key=acm_key),
-        ScopusAdapter(api_key=scopus_key),
-        WebOfScienceAdapter(client=WebOfScienceClient(api_key=wos_key)),
-        GriTaxonomyAdapter(),
-        GhgProtocolWorkbooksAdapter(),
-        CopernicusDataspaceAdapter(client=CopernicusDataspaceClient()),
-        NasaEarthdataAdapter(client=NasaEarthdataClient()),
-        DifyKnowledgeBaseAdapter(
+    # Factories keep lookups cheap: only the requested adapter and its client are constructed.
+    factories: Dict[str, Callable[[], DataSourceAdapter]] = {
+        "grid_intensity_cli": GridIntensityCLIAdapter,
+        "google_earth_engine": GoogleEarthEngineCLIAdapter,
+        "ipcc_ddc": lambda: IPCCDDCAdapter(client=ZenodoCommunityClient()),
+        "ipbes_data_portal": lambda: IPBESAdapter(client=ZenodoCommunityClient()),
+        "un_sdg_api": lambda: UNSDGAdapter(client=UNSDGClient()),
+        "semantic_scholar": lambda: SemanticScholarAdapter(client=SemanticScholarClient(api_key=semantic_key)),
+        "openalex": lambda: OpenAlexAdapter(client=OpenAlexClient(mailto=openalex_mailto)),
+        "ilostat": lambda: ILOSTATAdapter(client=ILOSTATClient(cookies=ilostat_cookies)),
+        "imf_climate_dashboard": lambda: IMFClimateAdapter(client=IMFClimateClient()),
+        "transparency_international_cpi": lambda: TransparencyCPIAdapter(client=TransparencyCPIClient()),
+        "wikidata": lambda: WikidataAdapter(client=WikidataClient()),
+        "world_bank_sustainability": lambda: WorldBankAdapter(client=WorldBankClient()),
+        "arxiv": lambda: ArxivAdapter(client=ArxivClient()),
+        "github_topics": lambda: GitHubTopicsAdapter(client=GitHubTopicsClient(token=github_token)),
+        "osdg_api": lambda: OSDGAdapter(client=OSDGClient(api_token=osdg_token)),
+        "crossref": lambda: CrossrefAdapter(client=CrossrefClient(mailto=crossref_mailto)),
+        "kaggle": lambda: KaggleAdapter(client=KaggleClient(username=kaggle_username, key=kaggle_key)),
+        "dimensions_ai": lambda: DimensionsAIAdapter(client=DimensionsAIClient(api_key=dimensions_key)),
+        "lens_org_api": lambda: LensOrgAdapter(client=LensOrgClient(api_key=lens_key)),
+        "open_supply_hub": lambda: OpenSupplyHubAdapter(client=OpenSupplyHubClient(api_key=open_supply_key)),
+        "cdp_climate": lambda: CdpClimateAdapter(api_key=cdp_key),
+        "lseg_esg": lambda: LsegESGAdapter(api_key=lseg_key),
+        "msci_esg": lambda: MsciESGAdapter(api_key=msci_key),
+        "sustainalytics": lambda: SustainalyticsAdapter(api_key=sustainalytics_key),
+        "sp_global_esg": lambda: SpGlobalESGAdapter(api_key=spglobal_key),
+        "iss_esg": lambda: IssESGAdapter(api_key=iss_key),
+        "acm_digital_library": lambda: AcmDigitalLibraryAdapter(api_key=acm_key),
+        "scopus": lambda: ScopusAdapter(api_key=scopus_key),
+        "web_of_science": lambda: WebOfScienceAdapter(client=WebOfScienceClient(api_key=wos_key)),
+        "gri_taxonomy": GriTaxonomyAdapter,
+        "ghg_protocol_workbooks": GhgProtocolWorkbooksAdapter,
+        "esa_copernicus": lambda: CopernicusDataspaceAdapter(client=CopernicusDataspaceClient()),
+        "nasa_earthdata": lambda: NasaEarthdataAdapter(client=NasaEarthdataClient()),
+        "dify_knowledge": lambda: DifyKnowledgeBaseAdapter(
             client=DifyKnowledgeBaseClient(api_key=dify_api_key, base_url=dify_base_url),
             dataset_id=dify_dataset_id,
             test_query=dify_test_query,
             retrieval_model=dify_retrieval_model,
         ),
-        ChartMCPAdapter(),
-        OpenAIDeepResearchAdapter(settings=context.secrets.openai),
-        GeminiDeepResearchAdapter(settings=context.secrets.gemini),
-    )
-    for adapter in adapters:
-        if source_id == adapter.source_id:
-            return adapter
+        "chart_mcp_server": ChartMCPAdapter,
+        "openai_deep_research": lambda: OpenAIDeepResearchAdapter(settings=context.secrets.openai),
+        "gemini_deep_research": lambda: GeminiDeepResearchAdapter(settings=context.secrets.gemini),
+    }
+    factory = factories.get(source_id)
+    if factory is not None:
+        return factory()
 
     mcp_configs = load_mcp_server_configs(context.secrets)
     config = mcp_configs.get(source_id)
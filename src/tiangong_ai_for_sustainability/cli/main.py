@@ -9,6 +9,7 @@ heavier workflows.
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from importlib import resources
 from pathlib import Path
@@ -62,6 +63,9 @@ research_app.add_typer(workflow_app, name="workflow")
 _CURRENT_YEAR = datetime.now(UTC).year
 _DEEP_PROFILE_CHOICES = tuple(sorted(DEEP_RESEARCH_PROFILES))
 _CITATION_PROFILE_CHOICES = tuple(sorted(CITATION_PROFILES))
+# Verification is network-bound and each adapter talks to a different host, so
+# multi-source commands overlap the round-trips instead of running them serially.
+_VERIFY_MAX_WORKERS = 8
 
 
 def _load_registry(registry_file: Optional[Path]) -> DataSourceRegistry:
@@ -384,9 +388,7 @@ def sources_audit(
         typer.echo("No data sources available for audit.")
         raise typer.Exit(code=0)
 
-    records: List[Dict[str, Any]] = []
-    failures = 0
-    for descriptor in descriptors:
+    def audit_descriptor(descriptor: DataSourceDescriptor) -> Dict[str, Any]:
         enabled = context.is_enabled(descriptor.source_id)
         record: Dict[str, Any] = {
             "id": descriptor.source_id,
@@ -418,10 +420,11 @@ def sources_audit(
                 record["message"] = verification.message
                 if verification.details is not None:
                     record["details"] = dict(verification.details)
+        return record
 
-        if not record["success"]:
-            failures += 1
-        records.append(record)
+    with ThreadPoolExecutor(max_workers=min(_VERIFY_MAX_WORKERS, len(descriptors))) as executor:
+        records: List[Dict[str, Any]] = list(executor.map(audit_descriptor, descriptors))
+    failures = sum(1 for record in records if not record["success"])
 
     if output_json:
         typer.echo(json.dumps({"results": records}, ensure_ascii=False, indent=2))
@@ -469,8 +472,9 @@ def sources_verify(
         failures = 0
         passed_records: List[Tuple[str, str]] = []
         failed_records: List[Tuple[str, str]] = []
-        for descriptor in descriptors:
-            success, message, details = _verify_descriptor(descriptor, context, services)
+        with ThreadPoolExecutor(max_workers=min(_VERIFY_MAX_WORKERS, len(descriptors))) as executor:
+            outcomes = list(executor.map(lambda descriptor: _verify_descriptor(descriptor, context, services), descriptors))
+        for descriptor, (success, message, details) in zip(descriptors, outcomes):
             result_label = "pass" if success else "fail"
             typer.echo(f"{descriptor.source_id:<22} {result_label:<7} {message}")
             if details:
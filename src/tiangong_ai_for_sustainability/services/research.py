@@ -10,18 +10,52 @@ start with lightweight registry-aware utilities.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+import threading
+import time
+from dataclasses import dataclass, field, fields, is_dataclass
 from logging import LoggerAdapter
-from typing import Any, Dict, Mapping, Optional, Sequence
+from typing import Any, Dict, Hashable, Mapping, Optional, Sequence, Tuple, TypeVar
 
 from ..adapters import AdapterError, ChartMCPAdapter, DataSourceAdapter, VerificationResult
-from ..adapters.api import ArxivClient, CrossrefClient, GitHubTopicsClient, KaggleClient, OpenAlexClient, OSDGClient, SemanticScholarClient, UNSDGClient
+from ..adapters.api import ArxivClient, BaseAPIClient, CrossrefClient, GitHubTopicsClient, KaggleClient, OpenAlexClient, OSDGClient, ResponseCache, SemanticScholarClient, UNSDGClient
 from ..adapters.environment import GridIntensityCLIAdapter
 from ..core import DataSourceDescriptor, DataSourceRegistry, DataSourceStatus, ExecutionContext, get_logger
 from ..core.mcp_client import MCPToolClient
 from ..core.mcp_config import MCPServerConfig, load_mcp_server_configs
 from ..core.prompts import LoadedPromptTemplate, PromptTemplateError, load_prompt_template
 
+HTTP_CACHE_TTL_ENV = "TIANGONG_HTTP_CACHE_TTL"
+VERIFICATION_CACHE_TTL = 60.0
+
+_ClientT = TypeVar("_ClientT", bound=BaseAPIClient)
+
+# Attributes that change what a verification call targets or authenticates with. Every
+# credential-bearing setting must appear here, otherwise a success recorded under one
+# credential would be replayed after it changes or is removed. ``settings`` and ``config``
+# hold the deep-research and remote MCP credentials and are snapshotted field by field.
+_ADAPTER_KEY_ATTRS = ("api_key", "endpoint", "dataset_id", "settings", "config")
+_CLIENT_KEY_ATTRS = ("base_url", "api_key", "username", "key", "mailto", "default_headers", "cookies")
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return frozenset((name, _freeze(item)) for name, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return (type(value).__qualname__, *((item.name, _freeze(getattr(value, item.name))) for item in fields(value)))
+    return value
+
+
+def _verification_cache_key(source_id: str, adapter: DataSourceAdapter) -> Tuple[Hashable, ...]:
+    client = getattr(adapter, "client", None)
+    return (
+        source_id,
+        type(adapter).__qualname__,
+        *(_freeze(getattr(adapter, name, None)) for name in _ADAPTER_KEY_ATTRS),
+        *(_freeze(getattr(client, name, None)) for name in _CLIENT_KEY_ATTRS),
+    )
+
 
 @dataclass(slots=True)
 class ResearchServices:
@@ -41,6 +75,10 @@ class ResearchServices:
     _sdg_goal_cache: Optional[Dict[str, Dict[str, Any]]] = field(default=None, init=False, repr=False)
     _mcp_configs: Optional[Dict[str, MCPServerConfig]] = field(default=None, init=False, repr=False)
     _mcp_client: Optional[MCPToolClient] = field(default=None, init=False, repr=False)
+    # Successful verifications keyed by source and adapter configuration, so back-to-back
+    # registry checks within one command reuse recent results.
+    _verification_cache: Dict[Tuple[Hashable, ...], Tuple[float, VerificationResult]] = field(default_factory=dict, init=False, repr=False)
+    _verification_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if hasattr(self.context, "get_logger"):
@@ -66,7 +104,7 @@ class ResearchServices:
         self._require_source_enabled(source_id)
         return descriptor
 
-    def verify_source(self, source_id: str, adapter: Optional[DataSourceAdapter] = None) -> VerificationResult:
+    def verify_source(self, source_id: str, adapter: Optional[DataSourceAdapter] = None, *, force: bool = False) -> VerificationResult:
         """
         Run verification for a source.
 
@@ -77,6 +115,8 @@ class ResearchServices:
         adapter:
             Optional adapter overriding automatic lookup. When ``None`` the
             method performs registry-level checks only.
+        force:
+            Bypass results memoised within :data:`VERIFICATION_CACHE_TTL`.
         """
 
         descriptor = self.registry.get(source_id)
@@ -90,7 +130,7 @@ class ResearchServices:
             )
 
         if adapter:
-            return adapter.verify()
+            return self._verify_adapter(source_id, adapter, force=force)
 
         return VerificationResult(
             success=True,
@@ -98,6 +138,28 @@ class ResearchServices:
             details={"status": descriptor.status.value},
         )
 
+    def _verify_adapter(self, source_id: str, adapter: DataSourceAdapter, *, force: bool = False) -> VerificationResult:
+        try:
+            key = _verification_cache_key(source_id, adapter)
+            hash(key)
+        except TypeError:  # pragma: no cover - unhashable adapter configuration
+            return adapter.verify()
+
+        now = time.monotonic()
+        if not force:
+            with self._verification_lock:
+                entry = self._verification_cache.get(key)
+            if entry is not None and now - entry[0] < VERIFICATION_CACHE_TTL:
+                self.logger.debug("Reusing recent verification", extra={"source_id": source_id})
+                return entry[1]
+
+        result = adapter.verify()
+        # Only successes are memoised so fixes to credentials or connectivity show up immediately.
+        if result.success:
+            with self._verification_lock:
+                self._verification_cache[key] = (now, result)
+        return result
+
     def _require_source_enabled(self, source_id: str) -> None:
         if not self.context.is_enabled(source_id):
             raise AdapterError(f"Data source '{source_id}' is disabled in the current execution context.")
@@ -138,24 +200,39 @@ class ResearchServices:
                 return value
         return None
 
+    def _with_response_cache(self, client: _ClientT) -> _ClientT:
+        """Attach the on-disk HTTP cache when ``TIANGONG_HTTP_CACHE_TTL`` is set."""
+
+        raw_ttl = os.getenv(HTTP_CACHE_TTL_ENV)
+        if not raw_ttl:
+            return client
+        try:
+            ttl = float(raw_ttl)
+        except ValueError:
+            self.logger.warning("Ignoring invalid HTTP cache TTL", extra={"value": raw_ttl})
+            return client
+        if ttl > 0:
+            client.response_cache = ResponseCache(self.context.cache_dir / "http", ttl=ttl)
+        return client
+
     def un_sdg_client(self) -> UNSDGClient:
         self._require_source_enabled("un_sdg_api")
         if self._un_sdg_client is None:
-            self._un_sdg_client = UNSDGClient()
+            self._un_sdg_client = self._with_response_cache(UNSDGClient())
         return self._un_sdg_client
 
     def semantic_scholar_client(self) -> SemanticScholarClient:
         self._require_source_enabled("semantic_scholar")
         if self._semantic_scholar_client is None:
             api_key = self._get_secret("semantic_scholar", "api_key")
-            self._semantic_scholar_client = SemanticScholarClient(api_key=api_key)
+            self._semantic_scholar_client = self._with_response_cache(SemanticScholarClient(api_key=api_key))
         return self._semantic_scholar_client
 
     def openalex_client(self) -> OpenAlexClient:
         self._require_source_enabled("openalex")
         if self._openalex_client is None:
             mailto = self._get_secret("openalex", "mailto") or os.getenv("TIANGONG_OPENALEX_MAILTO") or "tiangong-cli@localhost"
-            self._openalex_client = OpenAlexClient(mailto=mailto)
+            self._openalex_client = self._with_response_cache(OpenAlexClient(mailto=mailto))
         return self._openalex_client
 
     def arxiv_client(self) -> ArxivClient:
@@ -168,14 +245,14 @@ class ResearchServices:
         self._require_source_enabled("github_topics")
         if self._github_topics_client is None:
             token = self._get_secret("github", "token")
-            self._github_topics_client = GitHubTopicsClient(token=token)
+            self._github_topics_client = self._with_response_cache(GitHubTopicsClient(token=token))
         return self._github_topics_client
 
     def osdg_client(self) -> OSDGClient:
         self._require_source_enabled("osdg_api")
         if self._osdg_client is None:
             api_token = self._get_secret("osdg", "api_token")
-            self._osdg_client = OSDGClient(api_token=api_token)
+            self._osdg_client = self._with_response_cache(OSDGClient(api_token=api_token))
         return self._osdg_client
 
     def crossref_client(self) -> CrossrefClient:
@@ -184,7 +261,7 @@ class ResearchServices:
             mailto = self._get_secret("crossref", "mailto") or os.getenv("TIANGONG_CROSSREF_MAILTO")
             if not mailto:
                 raise AdapterError("Crossref requires a contact email. Set crossref.mailto in .secrets or TIANGONG_CROSSREF_MAILTO.")
-            self._crossref_client = CrossrefClient(mailto=mailto)
+            self._crossref_client = self._with_response_cache(CrossrefClient(mailto=mailto))
         return self._crossref_client
 
     def kaggle_client(self) -> KaggleClient:
@@ -240,7 +317,7 @@ class ResearchServices:
         endpoint = self.chart_mcp_endpoint()
         adapter = ChartMCPAdapter(endpoint=endpoint)
         self.logger.info("Verifying AntV MCP chart endpoint", extra={"endpoint": endpoint})
-        return adapter.verify()
+        return self._verify_adapter(adapter.source_id, adapter)
 
     # -- Remote MCP helpers -----------------------------------------------------
 
@@ -546,21 +546,27 @@ def _enrich_with_semantic_scholar(services: ResearchServices, papers: List[Paper
     client = services.semantic_scholar_client()
     fields = ["title", "year", "citationCount", "url", "tldr"]
 
-    for paper in papers[: min(15, len(papers))]:
-        paper_id = None
+    lookups: List[Tuple[str, PaperRecord]] = []
+    for paper in papers[:15]:
         if paper.doi:
-            paper_id = f"DOI:{paper.doi}"
+            lookups.append((f"DOI:{paper.doi}", paper))
         elif paper.work_id.startswith("https://openalex.org/"):
-            paper_id = paper.work_id.split("/")[-1]
-
-        if not paper_id:
-            continue
-
-        try:
-            payload = client.get_paper(paper_id, fields=fields)
-        except APIError:
-            continue
+            lookups.append((paper.work_id.split("/")[-1], paper))
 
+    if not lookups:
+        return
+    try:
+        payloads: List[Any] = client.get_papers([paper_id for paper_id, _ in lookups], fields=fields)
+    except APIError:
+        # Fall back to per-paper lookups so one bad identifier only skips its own paper.
+        payloads = []
+        for paper_id, _ in lookups:
+            try:
+                payloads.append(client.get_paper(paper_id, fields=fields))
+            except APIError:
+                payloads.append(None)
+
+    for (_, paper), payload in zip(lookups, payloads):
         if isinstance(payload, Mapping):
             citation_override = payload.get("citationCount")
             if isinstance(citation_override, int) and citation_override > paper.citation_count:
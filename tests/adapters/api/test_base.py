@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from tiangong_ai_for_sustainability.adapters.api import base as base_module
+from tiangong_ai_for_sustainability.adapters.api.base import APIError, BaseAPIClient, ResponseCache
+
+
+class _MockTransportClient(BaseAPIClient):
+    def __init__(self, handler) -> None:
+        super().__init__(base_url="https://example.org")
+        self.handler = handler
+        self.builds = 0
+
+    def _build_client(self) -> httpx.Client:
+        self.builds += 1
+        return httpx.Client(base_url=self.base_url, headers=dict(self.default_headers), transport=httpx.MockTransport(self.handler))
+
+
+def test_base_client_reuses_http_client_across_requests():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    client = _MockTransportClient(handler)
+
+    assert client._get_json("/a") == {"ok": True}
+    assert client._post_json("/b", json_body={"q": 1}) == {"ok": True}
+    assert seen == ["/a", "/b"]
+    assert client.builds == 1
+
+
+def test_base_client_close_releases_http_client():
+    client = _MockTransportClient(lambda request: httpx.Response(200, json={}))
+
+    with client:
+        client._get_json("/a")
+        pooled = client._client
+        assert pooled is not None
+    assert client._client is None
+    assert pooled.is_closed
+
+    client._get_json("/a")
+    assert client.builds == 2
+    client.close()
+
+
+def test_base_client_serves_repeat_gets_from_response_cache(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, str(request.url)))
+        return httpx.Response(200, json={"n": len(calls)})
+
+    client = _MockTransportClient(handler)
+    client.response_cache = ResponseCache(tmp_path / "http", ttl=60)
+
+    assert client._get_json("/a", params={"q": "x"}) == {"n": 1}
+    assert client._get_json("/a", params={"q": "x"}) == {"n": 1}
+    assert client._get_json("/a", params={"q": "y"}) == {"n": 2}
+    assert client._post_json("/a", json_body={"q": "x"}) == {"n": 3}
+    assert client._post_json("/a", json_body={"q": "x"}) == {"n": 4}
+    assert len(calls) == 4
+
+    client.response_cache = ResponseCache(tmp_path / "http", ttl=0)
+    assert client._get_json("/a", params={"q": "x"}) == {"n": 5}
+
+
+def test_base_client_reports_malformed_json():
+    client = _MockTransportClient(lambda request: httpx.Response(200, content=b"{not json"))
+
+    with pytest.raises(APIError, match="Failed to decode JSON"):
+        client._get_json("/a")
+
+
+def test_base_client_retries_transport_errors(monkeypatch):
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.path)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr(base_module._RETRYING, "sleep", lambda seconds: None)
+    client = _MockTransportClient(handler)
+
+    assert client._get_json("/a") == {"ok": True}
+    assert len(attempts) == 3
+
+
+def test_base_client_raises_api_error_after_final_retry(monkeypatch):
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.path)
+        raise httpx.ConnectError("unreachable", request=request)
+
+    monkeypatch.setattr(base_module._RETRYING, "sleep", lambda seconds: None)
+    client = _MockTransportClient(handler)
+
+    with pytest.raises(APIError, match="HTTP error"):
+        client._get_json("/a")
+    assert len(attempts) == 3
+
+
+def test_base_client_builds_logger_lazily():
+    client = BaseAPIClient(base_url="https://example.org")
+
+    assert client._logger is None
+    logger = client.logger
+    assert client.logger is logger
+    assert logger.extra["base_url"] == "https://example.org"
+
+
+def test_base_client_post_merges_default_and_extra_headers():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        return httpx.Response(200, json={})
+
+    client = _MockTransportClient(handler)
+    client.default_headers["Authorization"] = "Bearer token"
+
+    client._post_json("/a", json_body={})
+    client._post_json("/a", json_body={}, headers={"X-Trace": "1"})
+
+    assert seen[0]["Authorization"] == "Bearer token"
+    assert "X-Trace" not in seen[0]
+    assert seen[1]["Authorization"] == "Bearer token"
+    assert seen[1]["X-Trace"] == "1"
+
+
+def test_base_clients_with_same_configuration_share_http_client():
+    first = BaseAPIClient(base_url="https://shared.example.org", default_headers={"X-Key": "a"})
+    second = BaseAPIClient(base_url="https://shared.example.org", default_headers={"X-Key": "b"})
+    other = BaseAPIClient(base_url="https://shared.example.org", timeout=5.0)
+
+    try:
+        shared = first._http_client()
+        assert second._http_client() is shared
+        assert other._http_client() is not shared
+
+        first.close()
+        assert not shared.is_closed
+        assert second._http_client() is shared
+    finally:
+        base_module.close_shared_clients()
+    assert shared.is_closed
+    assert second._http_client() is not shared
+    base_module.close_shared_clients()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_base_client_post_json_encodes_body(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(base_module, "orjson", None)
+    elif base_module.orjson is None:  # pragma: no cover - optional dependency
+        pytest.skip("orjson not installed")
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.headers["Content-Type"], json.loads(request.content)))
+        return httpx.Response(200, json={"ok": True})
+
+    client = _MockTransportClient(handler)
+
+    assert client._post_json("/a", json_body={"query": "climate", "top_k": 3}) == {"ok": True}
+    assert bodies == [("application/json", {"query": "climate", "top_k": 3})]
+
+
+def test_base_client_preflight_flags_invalid_base_url():
+    from tiangong_ai_for_sustainability.adapters.api.esa_copernicus import CopernicusDataspaceAdapter, CopernicusDataspaceClient
+
+    assert BaseAPIClient(base_url="https://example.org").preflight() is None
+    assert "Invalid base URL" in BaseAPIClient(base_url="example.org/api").preflight()
+
+    adapter = CopernicusDataspaceAdapter(client=CopernicusDataspaceClient(base_url="not a url"))
+    result = adapter.verify()
+
+    assert result.success is False
+    assert "Invalid base URL" in result.message
+
+
+def test_base_client_revalidates_expired_cache_entries(tmp_path):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"n": len(seen)}, headers={"ETag": '"v1"'})
+
+    client = _MockTransportClient(handler)
+    client.response_cache = ResponseCache(tmp_path / "http", ttl=0)
+
+    assert client._get_json("/a") == {"n": 1}
+    assert client._get_json("/a") == {"n": 1}
+    assert seen == [None, '"v1"']
+
+
+def test_api_clients_use_slots():
+    from tiangong_ai_for_sustainability.adapters.api.github_topics import GitHubTopicsClient
+    from tiangong_ai_for_sustainability.adapters.api.ilostat import ILOSTATClient
+    from tiangong_ai_for_sustainability.adapters.api.imf import IMFClimateClient
+    from tiangong_ai_for_sustainability.adapters.api.zenodo import ZenodoCommunityClient
+
+    for client in (GitHubTopicsClient(), ILOSTATClient(cookies={"session": "token"}), IMFClimateClient(), ZenodoCommunityClient()):
+        assert not hasattr(client, "__dict__")
+
+
+def test_base_client_stream_raises_api_error_for_error_status():
+    client = _MockTransportClient(lambda request: httpx.Response(404, content=b"missing"))
+
+    with pytest.raises(APIError, match="HTTP 404 error.*missing"):
+        with client._stream("GET", "/a"):
+            pass
+
+
+def test_response_cache_keys_on_credential_headers(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"n": len(calls)})
+
+    client = _MockTransportClient(handler)
+    client.response_cache = ResponseCache(tmp_path / "http", ttl=60)
+
+    client.default_headers["Authorization"] = "Bearer a"
+    assert client._get_json("/a") == {"n": 1}
+    assert client._get_json("/a") == {"n": 1}
+
+    client.close()
+    client.default_headers["Authorization"] = "Bearer revoked"
+    assert client._get_json("/a") == {"n": 2}
+    assert calls == ["Bearer a", "Bearer revoked"]
+
+
+def test_response_cache_keeps_ranged_responses_apart(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "Range" in request.headers:
+            return httpx.Response(206, content=b"<html>")
+        return httpx.Response(200, content=b"<html><title>full</title></html>")
+
+    client = _MockTransportClient(handler)
+    client.response_cache = ResponseCache(tmp_path / "http", ttl=60)
+
+    assert client._request("GET", "/a", headers={"Range": "bytes=0-5"}).content == b"<html>"
+    assert client._request("GET", "/a").content == b"<html><title>full</title></html>"
+
+
+def test_base_client_applies_default_header_changes_to_live_client():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={})
+
+    client = _MockTransportClient(handler)
+
+    client._get_json("/a")
+    client.default_headers["Authorization"] = "Bearer rotated"
+    client._get_json("/a")
+    with client._stream("GET", "/a"):
+        pass
+
+    assert seen == [None, "Bearer rotated", "Bearer rotated"]
+    assert client.builds == 1
@@ -22,14 +22,13 @@ collect_corpus = corpus_module.collect_corpus
 
 
 class DummyMCPClient:
-    def __init__(self, *args, **kwargs):
-        pass
+    instances = 0
 
-    def __enter__(self):
-        return self
+    def __init__(self, *args, **kwargs):
+        DummyMCPClient.instances += 1
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+    def close(self):
+        pass
 
     def invoke_tool(self, service_name, tool_name, arguments):
         payload = json.dumps(
@@ -57,6 +56,12 @@ def patch_mcp(monkeypatch):
     monkeypatch.setattr(corpus_module, "load_secrets", fake_load_secrets)
     monkeypatch.setattr(corpus_module, "load_mcp_server_configs", fake_load_configs)
     monkeypatch.setattr(corpus_module, "MCPToolClient", DummyMCPClient)
+    corpus_module._load_mcp_configs.cache_clear()
+    corpus_module._mcp_client.cache_clear()
+    DummyMCPClient.instances = 0
+    yield
+    corpus_module._load_mcp_configs.cache_clear()
+    corpus_module._mcp_client.cache_clear()
 
 
 def test_collect_corpus_writes_file(tmp_path):
@@ -78,3 +83,24 @@ def test_collect_corpus_writes_file(tmp_path):
     assert payload["concept_id"] == preset.concept_id
     assert payload["record_count"] == 1
     assert payload["records"][0]["content"].startswith("Example SAFER")
+
+
+def test_main_collects_several_concepts_with_one_secrets_load(tmp_path, monkeypatch):
+    calls = []
+
+    def counting_load_secrets(strict=True):
+        calls.append(strict)
+        return SimpleNamespace(data={}, openai=None, source_path=None)
+
+    monkeypatch.setattr(corpus_module, "load_secrets", counting_load_secrets)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["collect_mcp_corpus.py", "--concept", "safer", "nanotechnology", "--output", str(tmp_path / "placeholder.json")],
+    )
+
+    assert corpus_module.main() == 0
+    assert calls == [True]
+    assert DummyMCPClient.instances == 1
+    assert (tmp_path / "safer.json").exists()
+    assert (tmp_path / "sustainable_nanotechnology.json").exists()
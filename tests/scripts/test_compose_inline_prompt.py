@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT_PATH = REPO_ROOT / "scripts" / "tooling" / "compose_inline_prompt.py"
+SPEC = importlib.util.spec_from_file_location("compose_inline_prompt", SCRIPT_PATH)
+if SPEC is None or SPEC.loader is None:  # pragma: no cover - defensive
+    raise RuntimeError(f"Unable to load compose_inline_prompt module from {SCRIPT_PATH}")
+prompt_module = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = prompt_module
+SPEC.loader.exec_module(prompt_module)
+
+
+def test_inline_text_collapses_whitespace():
+    raw = "  # Title\r\n\r\n  First   line\n\tsecond line  \n\n"
+    assert prompt_module.inline_text(raw) == "# Title First line second line"
+
+
+def test_read_text_cached_refreshes_on_mtime_change(tmp_path):
+    path = tmp_path / "brief.md"
+    path.write_text("first", encoding="utf-8")
+    assert prompt_module.read_text_cached(path) == "first"
+
+    stat = path.stat()
+    path.write_text("second", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert prompt_module.read_text_cached(path) == "second"
+
+
+def test_main_writes_markdown_and_inline_outputs(tmp_path, capsys):
+    brief = tmp_path / "brief.md"
+    brief.write_text("Assess café supply chains.\n", encoding="utf-8")
+    spec = tmp_path / "spec.md"
+    spec.write_text("# Stage 1\n## Stage 2\n", encoding="utf-8")
+
+    exit_code = prompt_module.main(
+        [
+            "--user-prompt",
+            str(brief),
+            "--spec",
+            str(spec),
+            "--markdown-output",
+            str(tmp_path / "out"),
+            "--emit-inline",
+        ]
+    )
+
+    assert exit_code == 0
+    markdown = (tmp_path / "out" / prompt_module.MARKDOWN_OUTPUT_FILENAME).read_text(encoding="utf-8")
+    inline = (tmp_path / "out" / prompt_module.INLINE_OUTPUT_FILENAME).read_text(encoding="utf-8")
+    assert inline.startswith("[StudyBrief] Assess café supply chains. | [WorkflowSpec]")
+    assert "- Stage 1\n- Stage 2" in markdown
+    assert capsys.readouterr().out == f"{markdown}\n\n[inline] {inline}\n"
+
+
+def test_extract_headings_skips_deep_and_empty_headings():
+    markdown = "# Title\n#\nnot a heading\n#### Deep\n## Section \n### Sub\n"
+    assert prompt_module.extract_headings(markdown) == ["Title", "Section", "Sub"]
+    assert prompt_module.extract_headings(markdown, max_items=2) == ["Title", "Section"]
+
+
+def test_strip_front_matter():
+    assert prompt_module.strip_front_matter("---\ntitle: x\n---\n\n# Body\n") == "# Body\n"
+    assert prompt_module.strip_front_matter("\n---\r\na: 1\n----\nb: 2\n---  \r\n# Body") == "# Body"
+    assert prompt_module.strip_front_matter("---\ntitle: x\n---") == ""
+    assert prompt_module.strip_front_matter("# No front matter\n---\n") == "# No front matter\n---\n"
+    assert prompt_module.strip_front_matter("---\nunterminated\n") == "---\nunterminated\n"
+
+
+def test_read_text_cached_maps_large_files(tmp_path):
+    path = tmp_path / "large.md"
+    body = "# Heading\r\n" + "é" * prompt_module.MMAP_THRESHOLD_BYTES
+    path.write_bytes(body.encode("utf-8"))
+
+    assert prompt_module.read_text_cached(path) == body.replace("\r\n", "\n")
+
+
+def test_compose_prompt_with_disk_cache_reuses_entries(tmp_path, monkeypatch):
+    inputs = ("Brief", "# Stage 1\n", "# Rules\n")
+    first = prompt_module.compose_prompt_with_disk_cache(*inputs, cache_dir=tmp_path)
+    assert first == prompt_module.compose_prompt(*inputs)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def fail(*_args):
+        raise AssertionError("compose_prompt should not run on a cache hit")
+
+    monkeypatch.setattr(prompt_module, "compose_prompt", fail)
+    assert prompt_module.compose_prompt_with_disk_cache(*inputs, cache_dir=tmp_path) == first
+
+
+def test_compose_prompt_with_disk_cache_composes_once_when_enabled(tmp_path, monkeypatch):
+    monkeypatch.setenv(prompt_module.COMPOSE_CACHE_ENV, "1")
+    inputs = ("Brief", "# Stage 1\n", "# Rules\n")
+    calls = []
+    original = prompt_module.compose_prompt
+
+    def counting_compose(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(prompt_module, "compose_prompt", counting_compose)
+
+    first = prompt_module.compose_prompt_with_disk_cache(*inputs, cache_dir=tmp_path)
+    second = prompt_module.compose_prompt_with_disk_cache(*inputs, cache_dir=tmp_path)
+
+    assert first == second == original(*inputs)
+    assert calls == [inputs]
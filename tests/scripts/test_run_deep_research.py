@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT_PATH = REPO_ROOT / "scripts" / "examples" / "run_deep_research.py"
+SPEC = importlib.util.spec_from_file_location("run_deep_research", SCRIPT_PATH)
+if SPEC is None or SPEC.loader is None:  # pragma: no cover - defensive
+    raise RuntimeError(f"Unable to load run_deep_research module from {SCRIPT_PATH}")
+script_module = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = script_module
+SPEC.loader.exec_module(script_module)
+
+parse_mcp_server = script_module.parse_mcp_server
+
+
+def test_parse_mcp_server_reads_optional_keys():
+    config = parse_mcp_server(
+        "server_label=local-fs, server_url=http://127.0.0.1:3001,authorization=Bearer abc==,allowed_tools=search| fetch,require_manual_approval=Yes,headers=X-Api-Key: secret|X-Trace:1"
+    )
+
+    assert config.server_label == "local-fs"
+    assert config.server_url == "http://127.0.0.1:3001"
+    assert config.authorization == "Bearer abc=="
+    assert config.allowed_tools == ("search", "fetch")
+    assert config.require_manual_approval is True
+    assert config.custom_headers == {"X-Api-Key": "secret", "X-Trace": "1"}
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        ("server_label=a,server_url", "Expected key=value pairs"),
+        ("server_label=a,server_url=b,", "Expected key=value pairs"),
+        ("server_label=a", "Both server_label and server_url are required"),
+        ("server_label=a,server_url=b,colour=blue", "Unsupported keys in --mcp-server argument: colour"),
+        ("server_label=a,server_url=b,headers=broken", "colon-separated"),
+    ],
+)
+def test_parse_mcp_server_rejects_invalid_arguments(raw, message):
+    with pytest.raises(ValueError, match=message):
+        parse_mcp_server(raw)
+
+
+def test_build_parser_is_reused_without_leaking_defaults():
+    parser = script_module._build_parser()
+    assert script_module._build_parser() is parser
+
+    first = parser.parse_args(["question", "--tag", "pilot"])
+    second = parser.parse_args(["question"])
+    assert first.tags == ["pilot"]
+    assert second.tags == []
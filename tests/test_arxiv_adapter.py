@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from tiangong_ai_for_sustainability.adapters.api.arxiv import ArxivAdapter, ArxivAPIError
 
 
@@ -33,3 +35,99 @@ def test_arxiv_adapter_verify_failure():
 
     assert result.success is False
     assert "boom" in result.message
+
+
+def test_arxiv_client_serialises_results():
+    from datetime import datetime
+    from types import SimpleNamespace
+
+    from tiangong_ai_for_sustainability.adapters.api import arxiv as arxiv_module
+
+    result = SimpleNamespace(
+        entry_id="http://arxiv.org/abs/1707.08567v1",
+        get_short_id=lambda: "1707.08567v1",
+        title=" Mastering the Game of Go ",
+        summary=" Summary ",
+        published=datetime(2017, 7, 26, 12, 0, 0, 123),
+        updated=None,
+        doi=None,
+        primary_category="cs.AI",
+        categories=["cs.AI"],
+        pdf_url="http://arxiv.org/pdf/1707.08567v1",
+        links=[SimpleNamespace(href="http://arxiv.org/abs/1707.08567v1"), SimpleNamespace(href=None)],
+        authors=[SimpleNamespace(name="A. Author"), SimpleNamespace(name="")],
+    )
+
+    class DummyArxiv:
+        def results(self, search):
+            return iter([result])
+
+    client = arxiv_module.ArxivClient(client=DummyArxiv())
+
+    first = client.fetch_by_id("1707.08567")
+    first["authors"].append("Intruder")
+    second = client.search_papers("go")[0]
+
+    assert second["title"] == "Mastering the Game of Go"
+    assert second["year"] == 2017
+    assert second["published"] == "2017-07-26T12:00:00"
+    assert second["links"] == ["http://arxiv.org/abs/1707.08567v1"]
+    assert second["authors"] == ["A. Author"]
+    assert second["categories"] == ["cs.AI"]
+
+
+def test_arxiv_client_uses_larger_pages_for_big_searches():
+    import arxiv
+
+    from tiangong_ai_for_sustainability.adapters.api.arxiv import MAX_PAGE_SIZE, ArxivClient
+
+    base = arxiv.Client(delay_seconds=4.0, num_retries=2)
+    client = ArxivClient(client=base)
+
+    assert client._client_for(50) is base
+    bulk = client._client_for(750)
+    assert bulk is not base
+    assert bulk.page_size == 750
+    assert bulk.delay_seconds == 4.0
+    assert bulk.num_retries == 2
+    assert client._client_for(500) is bulk
+    assert client._client_for(10_000).page_size == MAX_PAGE_SIZE
+
+
+def test_arxiv_client_iterates_results_lazily():
+    from types import SimpleNamespace
+
+    from tiangong_ai_for_sustainability.adapters.api.arxiv import ArxivAPIError, ArxivClient
+
+    def make_result(index):
+        return SimpleNamespace(
+            entry_id=f"http://arxiv.org/abs/0000.0000{index}v1",
+            get_short_id=lambda: f"0000.0000{index}v1",
+            title=f"Paper {index}",
+            summary="",
+            published=None,
+            updated=None,
+            doi=None,
+            primary_category="cs.AI",
+            categories=[],
+            pdf_url=None,
+            links=[],
+            authors=[],
+        )
+
+    pulled = []
+
+    class DummyArxiv:
+        def results(self, search):
+            for index in range(3):
+                pulled.append(index)
+                yield make_result(index)
+            raise RuntimeError("page failed")
+
+    iterator = ArxivClient(client=DummyArxiv()).search_papers_iter("go", max_results=3)
+
+    assert next(iterator)["title"] == "Paper 0"
+    assert pulled == [0]
+    assert [item["title"] for item in (next(iterator), next(iterator))] == ["Paper 1", "Paper 2"]
+    with pytest.raises(ArxivAPIError, match="page failed"):
+        next(iterator)
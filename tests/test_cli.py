@@ -7,6 +7,7 @@ from typer.testing import CliRunner
 
 from tiangong_ai_for_sustainability.adapters.base import AdapterError, VerificationResult
 from tiangong_ai_for_sustainability.cli.main import app
+from tiangong_ai_for_sustainability.core.registry import DataSourceRegistry
 
 
 def invoke(cli_runner: CliRunner, args: list[str]):
@@ -58,6 +59,31 @@ def test_sources_verify_reports_failure(cli_runner, registry_file):
     assert "API key missing" in result.stdout
 
 
+def test_sources_verify_all_preserves_registry_order(cli_runner, registry_file):
+    def fake_verify(self, source_id, adapter=None):
+        return VerificationResult(success=True, message=f"{source_id} ok")
+
+    with (
+        patch(
+            "tiangong_ai_for_sustainability.cli.main.resolve_adapter",
+            return_value=None,
+        ),
+        patch(
+            "tiangong_ai_for_sustainability.cli.main.ResearchServices.verify_source",
+            fake_verify,
+        ),
+    ):
+        result = invoke(
+            cli_runner,
+            ["--registry", str(registry_file), "sources", "verify", "all"],
+        )
+
+    expected = [descriptor.source_id for descriptor in DataSourceRegistry.from_yaml(registry_file).iter_enabled(allow_blocked=True)]
+    verified = [line.split()[0] for line in result.stdout.splitlines() if line.endswith(" ok")]
+    assert result.exit_code == 0
+    assert verified == expected
+
+
 def test_sources_audit_success(cli_runner, registry_file):
     with (
         patch(
@@ -307,6 +307,7 @@ def test_resolve_adapter_imf(tmp_path):
     adapter = resolve_adapter("imf_climate_dashboard", context)
 
     assert isinstance(adapter, IMFClimateAdapter)
+    assert adapter.client.response_cache is None
 
 
 def test_resolve_adapter_transparency(tmp_path):
@@ -352,3 +353,45 @@ def test_resolve_adapter_gemini_deep_research(tmp_path):
     adapter = resolve_adapter("gemini_deep_research", context)
 
     assert isinstance(adapter, GeminiDeepResearchAdapter)
+
+
+def test_licensed_esg_adapter_falls_back_to_env_var(monkeypatch):
+    monkeypatch.delenv("TIANGONG_CDP_API_KEY", raising=False)
+    missing = CdpClimateAdapter().verify()
+
+    assert missing.success is False
+    assert "TIANGONG_CDP_API_KEY" in missing.message
+    assert missing.message is CdpClimateAdapter().verify().message
+
+    monkeypatch.setenv("TIANGONG_CDP_API_KEY", "cdp-token")
+    adapter = CdpClimateAdapter()
+
+    assert adapter.api_key == "cdp-token"
+    present = adapter.verify()
+    assert present.success is True
+    assert present.message == "CDP Climate Disclosure Dashboard credentials detected; upstream access requires licensed ingestion workflows."
+    assert present.message is CdpClimateAdapter().verify().message
+
+
+def test_resolve_adapter_factories_match_registry_ids(tmp_path):
+    from importlib import resources
+
+    from tiangong_ai_for_sustainability.core.registry import DataSourceRegistry
+
+    context = ExecutionContext.build_default(cache_dir=tmp_path / "cache")
+    with resources.as_file(resources.files("tiangong_ai_for_sustainability.resources.datasources") / "core.yaml") as registry_file:
+        registry = DataSourceRegistry.from_yaml(registry_file)
+
+    resolved = 0
+    for descriptor in registry.list():
+        adapter = resolve_adapter(descriptor.source_id, context)
+        if adapter is not None:
+            resolved += 1
+            assert adapter.source_id == descriptor.source_id
+    assert resolved >= 30
+
+
+def test_adapters_do_not_carry_instance_dicts():
+    for adapter in (CdpClimateAdapter(api_key="token"), ScopusAdapter(api_key="token"), CrossrefAdapter(), IMFClimateAdapter()):
+        assert not hasattr(adapter, "__dict__")
+    assert ScopusAdapter().verify().message is ScopusAdapter().verify().message
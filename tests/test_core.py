@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import logging
 
 import pytest
@@ -117,3 +118,20 @@ def test_log_separator_emits_visual_line(reset_logging_handlers):
     message = record.getMessage()
     assert "Pipeline" in message
     assert set(message) <= {"-", " ", "P", "i", "p", "e", "l", "n"}
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "tiangong_ai_for_sustainability",
+        "tiangong_ai_for_sustainability.adapters",
+        "tiangong_ai_for_sustainability.adapters.api",
+    ],
+)
+def test_lazy_package_exports_resolve(module_name):
+    module = importlib.import_module(module_name)
+
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    with pytest.raises(AttributeError):
+        getattr(module, "DoesNotExist")
@@ -70,3 +70,76 @@ def test_crossref_client_serialises_filters(monkeypatch):
 
     assert captured_params["filter"] == "from-pub-date:2020-01-01,type:journal-article,type:book-chapter"
     assert captured_params["mailto"] == "research@example.com"
+
+
+def test_crossref_client_paginates_concurrently(monkeypatch):
+    from tiangong_ai_for_sustainability.adapters.api.crossref import CrossrefClient
+
+    requested = []
+
+    def fake_get_json(self, path, *, params):
+        offset = params.get("offset", 0)
+        requested.append((offset, params["rows"]))
+        items = [{"DOI": f"10.1/{offset + index}"} for index in range(params["rows"])]
+        return {"message": {"total-results": 25, "items": items}}
+
+    monkeypatch.setattr(CrossrefClient, "_get_json", fake_get_json, raising=False)
+    client = CrossrefClient(mailto="research@example.com")
+
+    payload = client.search_works_paginated(total_rows=100, page_size=10, query="sustainability")
+
+    dois = [item["DOI"] for item in payload["message"]["items"]]
+    assert dois == [f"10.1/{index}" for index in range(25)]
+    assert sorted(requested) == [(0, 10), (10, 10), (20, 5)]
+
+
+def test_crossref_extract_year_handles_partial_dates():
+    from tiangong_ai_for_sustainability.adapters.api.crossref import _extract_year
+
+    assert _extract_year({"date-parts": [[2021, 5, 12]]}) == 2021
+    assert _extract_year({"date-parts": [["2019"]]}) == 2019
+    assert _extract_year({"date-parts": [[None]]}) is None
+    assert _extract_year({"date-parts": ["2020"]}) is None
+    assert _extract_year({"date-parts": []}) is None
+    assert _extract_year({}) is None
+    assert _extract_year(None) is None
+
+
+def test_crossref_client_bulk_lookup_batches_dois(monkeypatch):
+    from tiangong_ai_for_sustainability.adapters.api import crossref
+
+    captured = []
+
+    def fake_get_json(self, path, *, params):
+        captured.append(params)
+        dois = [entry.split(":", 1)[1] for entry in params["filter"].split(",")]
+        return {"message": {"items": [{"DOI": doi.lower(), "title": [doi]} for doi in dois if not doi.endswith("missing")]}}
+
+    monkeypatch.setattr(crossref.CrossrefClient, "_get_json", fake_get_json, raising=False)
+    monkeypatch.setattr(crossref, "DOI_BATCH_SIZE", 2)
+    client = crossref.CrossrefClient(mailto="research@example.com")
+
+    works = client.get_works_bulk(["10.1/A", "10.1/b", " 10.1/a ", "10.1/missing", "10.1/c"], select=["title"])
+
+    assert set(works) == {"10.1/A", "10.1/b", "10.1/c"}
+    assert works["10.1/A"]["title"] == ["10.1/A"]
+    assert len(captured) == 2
+    assert all(params["select"] == "title,DOI" for params in captured)
+    assert client.get_works_bulk([]) == {}
+
+
+def test_crossref_client_paginated_search_stops_at_offset_limit(monkeypatch):
+    from tiangong_ai_for_sustainability.adapters.api.crossref import MAX_OFFSET, CrossrefClient
+
+    requested = []
+
+    def fake_get_json(self, path, *, params):
+        requested.append(params.get("offset", 0))
+        return {"message": {"total-results": 50000, "items": [{}] * params["rows"]}}
+
+    monkeypatch.setattr(CrossrefClient, "_get_json", fake_get_json, raising=False)
+
+    payload = CrossrefClient().search_works_paginated(total_rows=20000, query="sustainability")
+
+    assert len(payload["message"]["items"]) == MAX_OFFSET
+    assert max(requested) < MAX_OFFSET
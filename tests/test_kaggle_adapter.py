@@ -56,3 +56,69 @@ def test_kaggle_adapter_verify_with_status_error():
     assert result.success is True
     assert result.details["dataset"] == "zynicide/wine-reviews"
     assert "status_error" in result.details
+
+
+def test_kaggle_client_imports_sdk_once(monkeypatch):
+    from types import SimpleNamespace
+
+    from tiangong_ai_for_sustainability.adapters.api import kaggle as kaggle_module
+
+    imports = []
+
+    class FakeKaggleApi:
+        pass
+
+    def fake_import(name):
+        imports.append(name)
+        return SimpleNamespace(KaggleApi=FakeKaggleApi)
+
+    kaggle_module._load_kaggle_api_cls.cache_clear()
+    monkeypatch.setattr(kaggle_module.importlib, "import_module", fake_import)
+    monkeypatch.setattr(kaggle_module, "_SHARED_APIS", {})
+    monkeypatch.delenv("KAGGLE_USERNAME", raising=False)
+    monkeypatch.delenv("KAGGLE_KEY", raising=False)
+    try:
+        first = kaggle_module.KaggleClient()._ensure_api()
+        second = kaggle_module.KaggleClient(username="other", key="secret")._ensure_api()
+    finally:
+        kaggle_module._load_kaggle_api_cls.cache_clear()
+
+    assert isinstance(first, FakeKaggleApi)
+    assert isinstance(second, FakeKaggleApi)
+    assert imports == ["kaggle.api.kaggle_api_extended"]
+
+
+def test_kaggle_clients_share_authenticated_api(monkeypatch):
+    from tiangong_ai_for_sustainability.adapters.api import kaggle as kaggle_module
+
+    class FakeKaggleApi:
+        authentications = 0
+
+        def authenticate(self):
+            FakeKaggleApi.authentications += 1
+
+    monkeypatch.setattr(kaggle_module, "_load_kaggle_api_cls", lambda: FakeKaggleApi)
+    monkeypatch.setattr(kaggle_module, "_SHARED_APIS", {})
+    monkeypatch.setattr(kaggle_module, "_AUTHENTICATED", set())
+    monkeypatch.delenv("KAGGLE_USERNAME", raising=False)
+    monkeypatch.delenv("KAGGLE_KEY", raising=False)
+
+    first = kaggle_module.KaggleClient(username="alice", key="k1")
+    second = kaggle_module.KaggleClient(username="alice", key="k1")
+    other = kaggle_module.KaggleClient(username="bob", key="k2")
+    for client in (first, second, other):
+        client.authenticate()
+
+    assert first._ensure_api() is second._ensure_api()
+    assert other._ensure_api() is not first._ensure_api()
+    assert FakeKaggleApi.authentications == 2
+
+
+def test_extract_dataset_details_handles_dicts_and_sdk_objects():
+    from types import SimpleNamespace
+
+    from tiangong_ai_for_sustainability.adapters.api.kaggle import _extract_dataset_details
+
+    assert _extract_dataset_details({"ref": "owner/data", "title": "", "name": "Data"}) == ("owner/data", "Data")
+    assert _extract_dataset_details(SimpleNamespace(ref=None, id="owner/data", title="Data")) == ("owner/data", "Data")
+    assert _extract_dataset_details(SimpleNamespace(id=42, name="")) == (None, None)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from tiangong_ai_for_sustainability.adapters.api.openalex import OpenAlexClient
+
+
+def test_openalex_iterate_works_serialises_filters_once(monkeypatch):
+    requests = []
+    serialised = []
+    original = OpenAlexClient._serialise_filters
+
+    def fake_get_json(self, path, *, params):
+        requests.append(dict(params))
+        page = len(requests)
+        return {"results": [{"id": f"W{page}"}], "meta": {"next_cursor": f"c{page}" if page < 3 else None}}
+
+    def counting_serialise(filters):
+        serialised.append(filters)
+        return original(filters)
+
+    monkeypatch.setattr(OpenAlexClient, "_get_json", fake_get_json, raising=False)
+    monkeypatch.setattr(OpenAlexClient, "_serialise_filters", staticmethod(counting_serialise))
+    client = OpenAlexClient(mailto="research@example.com")
+
+    works = list(client.iterate_works(filters={"publication_year": [2023, 2024]}, select=(name for name in ("id", "title"))))
+
+    assert [work["id"] for work in works] == ["W1", "W2", "W3"]
+    assert len(serialised) == 1
+    assert [params["cursor"] for params in requests] == ["*", "c1", "c2"]
+    assert all(params["filter"] == "publication_year:2023,publication_year:2024" for params in requests)
+    assert all(params["select"] == "id,title" for params in requests)
+    assert all(params["mailto"] == "research@example.com" for params in requests)
+
+
+def test_openalex_iterate_works_sharded_merges_shards_in_order(monkeypatch):
+    def fake_get_json(self, path, *, params):
+        year = params["filter"].rsplit(":", 1)[1]
+        if params["cursor"] == "*":
+            return {"results": [{"id": f"{year}-1"}], "meta": {"next_cursor": "next"}}
+        return {"results": [{"id": f"{year}-2"}], "meta": {"next_cursor": None}}
+
+    monkeypatch.setattr(OpenAlexClient, "_get_json", fake_get_json, raising=False)
+    client = OpenAlexClient()
+
+    works = client.iterate_works_sharded(
+        shard_filter_key="publication_year",
+        shard_values=[2022, 2023, 2024],
+        filters={"type": "article"},
+        max_workers=2,
+    )
+
+    assert [work["id"] for work in works] == ["2022-1", "2022-2", "2023-1", "2023-2", "2024-1", "2024-2"]
@@ -2,19 +2,22 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import httpx
+import pytest
+
 from tiangong_ai_for_sustainability.adapters.api import APIError
 from tiangong_ai_for_sustainability.adapters.api.ilostat import ILOSTATAdapter
-from tiangong_ai_for_sustainability.adapters.api.imf import EXPECTED_TITLE, IMFClimateAdapter
+from tiangong_ai_for_sustainability.adapters.api.imf import EXPECTED_TITLE, IMFClimateAdapter, IMFClimateClient
 from tiangong_ai_for_sustainability.adapters.api.ipbes import IPBESAdapter
 from tiangong_ai_for_sustainability.adapters.api.ipcc import IPCCDDCAdapter
-from tiangong_ai_for_sustainability.adapters.api.transparency import TransparencyCPIAdapter
+from tiangong_ai_for_sustainability.adapters.api.standards import GRI_MARKER, GriTaxonomyAdapter, StandardsLandingClient
+from tiangong_ai_for_sustainability.adapters.api.transparency import TransparencyCPIAdapter, TransparencyCPIClient
 from tiangong_ai_for_sustainability.adapters.api.wikidata import WikidataAdapter
 
 
 def test_ipcc_adapter_verify_success():
     client = MagicMock()
     client.list_recent_records.return_value = [{"metadata": {"title": "Atlas dataset", "doi": "10.1234/ipcc"}}]
-    client.fetch_latest_title.return_value = "Atlas dataset"
     adapter = IPCCDDCAdapter(client=client)
 
     result = adapter.verify()
@@ -23,6 +26,7 @@ def test_ipcc_adapter_verify_success():
     assert result.details["latest_title"] == "Atlas dataset"
     assert result.details["doi"] == "10.1234/ipcc"
     client.list_recent_records.assert_called_once_with(adapter.community_id, size=1)
+    client.fetch_latest_title.assert_not_called()
 
 
 def test_ipcc_adapter_verify_failure():
@@ -39,7 +43,6 @@ def test_ipcc_adapter_verify_failure():
 def test_ipbes_adapter_success():
     client = MagicMock()
     client.list_recent_records.return_value = [{"metadata": {"title": "IPBES report"}}]
-    client.fetch_latest_title.return_value = "IPBES report"
     adapter = IPBESAdapter(client=client)
 
     result = adapter.verify()
@@ -57,9 +60,20 @@ def test_ilostat_adapter_success():
 
     assert result.success is True
     assert result.details["dataset_id"] == "EMP_TEMP"
+    client.list_datasets.assert_called_once_with(limit=1)
     assert "Employment" in result.details["dataset_label"]
 
 
+def test_ilostat_adapter_uses_fallback_keys():
+    client = MagicMock()
+    client.list_datasets.return_value = [{"id": "", "datasetCode": 7, "code": "UNE_DEAP", "Title": "Unemployment"}]
+    adapter = ILOSTATAdapter(client=client)
+
+    result = adapter.verify()
+
+    assert result.details == {"dataset_id": "UNE_DEAP", "dataset_label": "Unemployment"}
+
+
 def test_ilostat_adapter_failure():
     client = MagicMock()
     client.list_datasets.side_effect = APIError("blocked")
@@ -93,6 +107,79 @@ def test_imf_climate_adapter_failure():
     assert "verification failed" in result.message.lower()
 
 
+def test_imf_climate_client_matches_title_in_ranged_response():
+    ranges = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ranges.append(request.headers.get("Range"))
+        body = b"<html><head><title>" + EXPECTED_TITLE.encode() + b"</title></head>" if len(ranges) == 1 else b"<html></html>"
+        return httpx.Response(206, content=body)
+
+    class MockIMFClimateClient(IMFClimateClient):
+        def _build_client(self) -> httpx.Client:
+            return httpx.Client(base_url=self.base_url, transport=httpx.MockTransport(handler))
+
+    client = MockIMFClimateClient()
+
+    assert client.fetch_homepage_title() == EXPECTED_TITLE
+    with pytest.raises(APIError, match="expected title"):
+        client.fetch_homepage_title()
+    assert ranges == ["bytes=0-65535", "bytes=0-65535"]
+
+
+def test_imf_climate_client_reuses_unchanged_homepage(tmp_path):
+    from tiangong_ai_for_sustainability.adapters.api.base import ResponseCache
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"shell"':
+            return httpx.Response(304, headers={"ETag": '"shell"'})
+        return httpx.Response(206, content=f"<title>{EXPECTED_TITLE}</title>".encode(), headers={"ETag": '"shell"'})
+
+    class MockIMFClimateClient(IMFClimateClient):
+        def _build_client(self) -> httpx.Client:
+            return httpx.Client(base_url=self.base_url, transport=httpx.MockTransport(handler))
+
+    client = MockIMFClimateClient()
+    client.response_cache = ResponseCache(tmp_path / "http", ttl=0)
+
+    assert client.fetch_homepage_title() == EXPECTED_TITLE
+    assert client.fetch_homepage_title() == EXPECTED_TITLE
+    assert seen == [None, '"shell"']
+
+
+def _standards_client(chunks):
+    class MockStandardsLandingClient(StandardsLandingClient):
+        def _build_client(self) -> httpx.Client:
+            return httpx.Client(base_url=self.base_url, transport=httpx.MockTransport(lambda request: httpx.Response(200, content=iter(chunks))))
+
+    return MockStandardsLandingClient(base_url="https://example.org")
+
+
+def test_standards_client_finds_marker_across_chunk_boundary():
+    client = _standards_client([b"<title>GRI Sta", b"ndards</title>"])
+
+    assert client.contains_marker("/", GRI_MARKER) is True
+    assert client.contains_marker("/", "Calculation Tools") is False
+
+
+def test_standards_client_stops_scanning_after_max_bytes():
+    client = _standards_client([b"x" * 1024, b"GRI Standards"])
+
+    assert client.contains_marker("/", GRI_MARKER, max_bytes=1024) is False
+
+
+def test_gri_taxonomy_adapter_reports_marker():
+    adapter = GriTaxonomyAdapter(client=_standards_client([b"<h1>GRI Standards</h1>"]))
+
+    result = adapter.verify()
+
+    assert result.success is True
+    assert result.details == {"marker": GRI_MARKER}
+
+
 def test_transparency_cpi_adapter_success():
     client = MagicMock()
     client.fetch_sample_row.return_value = {"country": "Exampleland", "2023": "67"}
@@ -106,6 +193,33 @@ def test_transparency_cpi_adapter_success():
     assert result.details["sample_score"] == "67"
 
 
+def test_transparency_cpi_client_reads_first_row_from_stream():
+    def rows():
+        yield b"country,2022,2023\n"
+        yield b"Denmark,90,90\n"
+        for index in range(1000):
+            yield f"Country {index},1,2\n".encode()
+
+    class MockTransparencyCPIClient(TransparencyCPIClient):
+        def _build_client(self) -> httpx.Client:
+            return httpx.Client(base_url=self.base_url, transport=httpx.MockTransport(lambda request: httpx.Response(200, content=rows())))
+
+    assert MockTransparencyCPIClient().fetch_sample_row() == {"country": "Denmark", "2022": "90", "2023": "90"}
+
+
+def test_transparency_cpi_client_keeps_quoted_newlines():
+    def chunks():
+        yield b'country,note,2023\r\n"Example'
+        yield b'land","first line\nsecond'
+        yield b' line",67\r\nOther,,1\r\n'
+
+    class MockTransparencyCPIClient(TransparencyCPIClient):
+        def _build_client(self) -> httpx.Client:
+            return httpx.Client(base_url=self.base_url, transport=httpx.MockTransport(lambda request: httpx.Response(200, content=chunks())))
+
+    assert MockTransparencyCPIClient().fetch_sample_row() == {"country": "Exampleland", "note": "first line\nsecond line", "2023": "67"}
+
+
 def test_transparency_cpi_adapter_failure():
     client = MagicMock()
     client.fetch_sample_row.side_effect = APIError("down")
@@ -144,3 +258,32 @@ def test_wikidata_adapter_failure():
 
     assert result.success is False
     assert "verification failed" in result.message.lower()
+
+
+def test_osdg_adapter_sample_text_defaults_to_module_constant():
+    from tiangong_ai_for_sustainability.adapters.api.osdg import SAMPLE_TEXT, OSDGAdapter
+
+    client = MagicMock()
+    client.classify_text.return_value = {"result": []}
+
+    assert OSDGAdapter(client=client).verify().success is True
+    OSDGAdapter(client=client, SAMPLE_TEXT="Clean water for all.").verify()
+
+    assert [call.args for call in client.classify_text.call_args_list] == [(SAMPLE_TEXT,), ("Clean water for all.",)]
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ({"feed": {"entry": [{"id": "C1"}, {"id": "C2"}]}}, {"id": "C1"}),
+        ({"feed": {"entry": []}}, None),
+        ({"feed": {}}, None),
+        ({"feed": None}, None),
+        ({"feed": {"entry": ["C1"]}}, None),
+        ({}, None),
+    ],
+)
+def test_nasa_earthdata_extract_first_entry(payload, expected):
+    from tiangong_ai_for_sustainability.adapters.api.nasa_earthdata import _extract_first_entry
+
+    assert _extract_first_entry(payload) == expected
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from tiangong_ai_for_sustainability.adapters.api import semantic_scholar as semantic_scholar_module
+from tiangong_ai_for_sustainability.adapters.api.base import APIError
+from tiangong_ai_for_sustainability.adapters.api.semantic_scholar import SemanticScholarClient
+
+
+def test_semantic_scholar_get_papers_batches_ids(monkeypatch):
+    calls = []
+
+    def fake_post_json(self, path, *, json_body=None, headers=None, params=None):
+        calls.append((path, list(json_body["ids"]), params))
+        return [None if paper_id == "missing" else {"paperId": paper_id} for paper_id in json_body["ids"]]
+
+    monkeypatch.setattr(SemanticScholarClient, "_post_json", fake_post_json, raising=False)
+    monkeypatch.setattr(semantic_scholar_module, "BATCH_SIZE", 2)
+    client = SemanticScholarClient()
+
+    papers = client.get_papers(["DOI:10.1/a", "missing", "arXiv:1708.08021"], fields=["title", "year"])
+
+    assert papers == [{"paperId": "DOI:10.1/a"}, None, {"paperId": "arXiv:1708.08021"}]
+    assert calls == [
+        ("/paper/batch", ["DOI:10.1/a", "missing"], {"fields": "title,year"}),
+        ("/paper/batch", ["arXiv:1708.08021"], {"fields": "title,year"}),
+    ]
+
+
+def test_semantic_scholar_get_papers_rejects_misaligned_payload(monkeypatch):
+    monkeypatch.setattr(SemanticScholarClient, "_post_json", lambda self, path, **kwargs: [], raising=False)
+
+    with pytest.raises(APIError, match="batch lookup"):
+        SemanticScholarClient().get_papers(["DOI:10.1/a"])
@@ -45,3 +45,108 @@ def test_research_services_classify_text_dry_run(tmp_path, registry_file):
     services = _make_services(tmp_path, registry_file, dry_run=True)
     payload = services.classify_text_with_osdg("Sustainability matters.")
     assert payload["note"].startswith("Dry-run")
+
+
+def test_research_services_http_cache_opt_in(tmp_path, registry_file, monkeypatch):
+    services = _make_services(tmp_path, registry_file)
+    context = services.context
+    context.enable("un_sdg_api")
+
+    monkeypatch.delenv("TIANGONG_HTTP_CACHE_TTL", raising=False)
+    assert services.un_sdg_client().response_cache is None
+
+    monkeypatch.setenv("TIANGONG_HTTP_CACHE_TTL", "60")
+    services = ResearchServices(registry=services.registry, context=context)
+    cache = services.un_sdg_client().response_cache
+    assert cache is not None
+    assert cache.directory == context.cache_dir / "http"
+    assert cache.ttl == 60.0
+
+
+def test_research_services_memoises_successful_verification(tmp_path, registry_file):
+    from tiangong_ai_for_sustainability.adapters.base import VerificationResult
+
+    services = _make_services(tmp_path, registry_file)
+    adapter = MagicMock()
+    adapter.client.api_key = "token"
+    adapter.client.base_url = "https://example.org"
+    adapter.endpoint = None
+    adapter.verify.return_value = VerificationResult(success=True, message="ok")
+
+    first = services.verify_source("un_sdg_api", adapter)
+    second = services.verify_source("un_sdg_api", adapter)
+    services.verify_source("un_sdg_api", adapter, force=True)
+
+    assert first is second
+    assert adapter.verify.call_count == 2
+
+    ResearchServices(registry=services.registry, context=services.context).verify_source("un_sdg_api", adapter)
+    assert adapter.verify.call_count == 3
+
+    adapter.verify.reset_mock()
+    adapter.client.api_key = "other"
+    adapter.verify.return_value = VerificationResult(success=False, message="down")
+    services.verify_source("un_sdg_api", adapter)
+    services.verify_source("un_sdg_api", adapter)
+    assert adapter.verify.call_count == 2
+
+
+def test_research_services_verification_cache_tracks_credentials(tmp_path, registry_file, monkeypatch):
+    from tiangong_ai_for_sustainability.adapters.api import GitHubTopicsClient
+    from tiangong_ai_for_sustainability.adapters.api.esg import CdpClimateAdapter
+    from tiangong_ai_for_sustainability.adapters.api.github_topics import GitHubTopicsAdapter
+    from tiangong_ai_for_sustainability.adapters.base import VerificationResult
+
+    monkeypatch.delenv(CdpClimateAdapter.env_var, raising=False)
+    services = _make_services(tmp_path, registry_file)
+
+    assert services.verify_source("un_sdg_api", CdpClimateAdapter(api_key="token")).success is True
+    assert services.verify_source("un_sdg_api", CdpClimateAdapter()).success is False
+
+    calls = []
+
+    def fake_verify(self):
+        calls.append(self.client.default_headers.get("Authorization"))
+        return VerificationResult(success=True, message="ok")
+
+    monkeypatch.setattr(GitHubTopicsAdapter, "verify", fake_verify)
+    first = GitHubTopicsAdapter(client=GitHubTopicsClient(token="a"))
+    second = GitHubTopicsAdapter(client=GitHubTopicsClient(token="b"))
+
+    services.verify_source("un_sdg_api", first)
+    services.verify_source("un_sdg_api", first)
+    services.verify_source("un_sdg_api", second)
+
+    assert len(calls) == 2 and calls[0] != calls[1]
+
+
+def test_research_services_verification_cache_tracks_settings_and_config(tmp_path, registry_file, monkeypatch):
+    from tiangong_ai_for_sustainability.adapters.base import VerificationResult
+    from tiangong_ai_for_sustainability.adapters.tools.deep_research import OpenAIDeepResearchAdapter
+    from tiangong_ai_for_sustainability.adapters.tools.remote_mcp import RemoteMCPAdapter
+    from tiangong_ai_for_sustainability.config import OpenAISettings
+    from tiangong_ai_for_sustainability.core.mcp_config import MCPServerConfig
+
+    calls = []
+
+    def fake_verify(self):
+        calls.append(type(self).__name__)
+        return VerificationResult(success=True, message="ok")
+
+    monkeypatch.setattr(OpenAIDeepResearchAdapter, "verify", fake_verify)
+    monkeypatch.setattr(RemoteMCPAdapter, "verify", fake_verify)
+    services = _make_services(tmp_path, registry_file)
+
+    openai = OpenAIDeepResearchAdapter(settings=OpenAISettings(api_key="a"))
+    services.verify_source("un_sdg_api", openai)
+    services.verify_source("un_sdg_api", openai)
+    openai.settings.api_key = "b"
+    services.verify_source("un_sdg_api", openai)
+
+    mcp = RemoteMCPAdapter(config=MCPServerConfig(source_id="un_sdg_api", service_name="demo", url="https://mcp.example.org", api_key="a"))
+    services.verify_source("un_sdg_api", mcp)
+    services.verify_source("un_sdg_api", mcp)
+    mcp.config.api_key = "b"
+    services.verify_source("un_sdg_api", mcp)
+
+    assert calls == ["OpenAIDeepResearchAdapter", "OpenAIDeepResearchAdapter", "RemoteMCPAdapter", "RemoteMCPAdapter"]
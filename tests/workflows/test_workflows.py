@@ -47,6 +47,7 @@ class DummyServices:
                 ]
             },
             get_paper=lambda paper_id, fields=None: {"citationCount": 160, "url": "https://example.com/enriched"},
+            get_papers=lambda paper_ids, fields=None: [{"citationCount": 160, "url": "https://example.com/enriched"} for _ in paper_ids],
         )
         self._openalex = SimpleNamespace(iterate_works=lambda **kwargs: [])
         self._arxiv = SimpleNamespace(
@@ -730,3 +731,44 @@ def test_run_synthesis_workflow_skip_llm(tmp_path, dummy_services, monkeypatch):
 
     assert artifacts.llm_summary is None
     assert artifacts.report_path.exists()
+
+
+def test_semantic_scholar_enrichment_falls_back_to_single_lookups():
+    from tiangong_ai_for_sustainability.adapters.api import APIError
+    from tiangong_ai_for_sustainability.workflows.citation_template import _enrich_with_semantic_scholar
+
+    def make_paper(doi):
+        return PaperRecord(
+            source_id="openalex",
+            work_id=f"https://openalex.org/{doi}",
+            title=doi,
+            year=2024,
+            citation_count=1,
+            doi=doi,
+            url=None,
+            journal=None,
+            authors=[],
+            abstract="",
+            concepts=[],
+            keyword_hits={},
+            extra={},
+        )
+
+    def get_papers(paper_ids, fields=None):
+        raise APIError("HTTP 400 error")
+
+    def get_paper(paper_id, fields=None):
+        if paper_id == "DOI:10.1/bad":
+            raise APIError("HTTP 404 error")
+        return {"citationCount": 99, "url": f"https://example.com/{paper_id}"}
+
+    client = SimpleNamespace(get_papers=get_papers, get_paper=get_paper)
+    services = SimpleNamespace(semantic_scholar_client=lambda: client)
+    good, bad = make_paper("10.1/good"), make_paper("10.1/bad")
+
+    _enrich_with_semantic_scholar(services, [good, bad])
+
+    assert good.citation_count == 99
+    assert good.url == "https://example.com/DOI:10.1/good"
+    assert bad.citation_count == 1
+    assert bad.url is None